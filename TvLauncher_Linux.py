@@ -1860,6 +1860,7 @@ class LumaTVOS(QMainWindow):
         """)
         instructions.setAlignment(Qt.AlignmentFlag.AlignCenter)
         main_layout.addWidget(instructions)
+        self.instructions_label = instructions
         main_layout.addSpacing(8)
         self.showFullScreen()
    
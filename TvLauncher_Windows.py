@@ -2,21 +2,35 @@ import sys
 import json
 import subprocess
 import os
+import ctypes
+import functools
+import hashlib
+import locale
+import multiprocessing
+import queue
+import re
+import stat
+import tempfile
+import threading
+import time
 import winreg
+from concurrent.futures import Future, ThreadPoolExecutor
+from ctypes import wintypes
+from datetime import datetime
 from pathlib import Path
+from urllib.parse import quote
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout,
     QHBoxLayout, QLabel, QPushButton, QFileDialog,
-    QDialog, QLineEdit, QMessageBox, QGraphicsDropShadowEffect,
+    QDialog, QLineEdit, QMessageBox, QGraphicsScene, QGraphicsPixmapItem, QGraphicsBlurEffect,
     QListWidget, QListWidgetItem, QProgressBar, QProgressDialog
 )
 from PyQt6.QtCore import (
-    Qt, QPropertyAnimation, QEasingCurve, QPoint, QSize,
-    QParallelAnimationGroup, QTimer, QCoreApplication,
-    QThread, pyqtSignal
+    Qt, QPropertyAnimation, QEasingCurve, QPoint, QSize, QRectF,
+    QTimer, QCoreApplication, QEventLoop,
+    QObject, QRunnable, QThreadPool, pyqtSignal
 )
-from PyQt6.QtGui import QPixmap, QFont, QKeyEvent, QPainter, QColor, QIcon
-import psutil
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage, QFont, QKeyEvent, QPainter, QPainterPath, QColor, QIcon
 from modules.app_reorder import integrate_reorder_mode
 from modules.search_widget import QuickSearchWidget
 
@@ -32,12 +46,40 @@ except ImportError:
 # Try to import requests for image downloading
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
     print("Warning: requests not installed. Online image search disabled.")
     print("Install with: pip install requests")
 
+# Locale per data e ora: impostato una volta sola all'avvio
+try:
+    locale.setlocale(locale.LC_TIME, '')
+except locale.Error:
+    try:
+        locale.setlocale(locale.LC_TIME, 'C')
+    except locale.Error:
+        pass
+try:
+    _CLOCK_FORMAT = "%I:%M %p" if time.strftime("%p") else "%H:%M"  # AM/PM solo se il locale lo usa
+except ValueError:
+    _CLOCK_FORMAT = "%H:%M"
+_date_cache = (None, "")  # (giorno ordinale, data formattata)
+
+
+def clock_strings(now):
+    """Ora e data formattate; la data viene ricalcolata solo al cambio di giorno"""
+    global _date_cache
+    day = now.toordinal()
+    if _date_cache[0] != day:
+        parts = now.strftime("%d %B %Y").split()
+        if len(parts) >= 2:
+            parts[1] = parts[1].capitalize()
+        _date_cache = (day, " ".join(parts))
+    return now.strftime(_CLOCK_FORMAT), _date_cache[1]
+
 
 class ResponsiveScaling:
     """Resolution based responsive scaling"""
@@ -59,16 +101,31 @@ class ResponsiveScaling:
         # Usa il minore dei due per mantenere l'aspect ratio
         self.scale_factor = min(width_scale, height_scale)
        
+        # Valori interi già scalati (pixel e font usati nell'interfaccia)
+        self._scale_int_lut = [int(i * self.scale_factor) for i in range(4096)]
+       
         print(f"📐 Screen: {self.screen_width}x{self.screen_height}")
         print(f"📐 Scale factor: {self.scale_factor:.2f}")
    
     def scale(self, value):
         """Scala un valore in base alla risoluzione"""
+        if type(value) is int and 0 <= value < 4096:
+            return self._scale_int_lut[value]
         return int(value * self.scale_factor)
    
-    def scale_font(self, base_size):
-        """Scala la dimensione del font"""
-        return int(base_size * self.scale_factor)
+    # Scala la dimensione del font: stessa tabella, senza una chiamata in più
+    scale_font = scale
+
+
+_SCALING = None
+
+
+def get_scaling():
+    """ResponsiveScaling condiviso: la geometria dello schermo viene letta una sola volta"""
+    global _SCALING
+    if _SCALING is None:
+        _SCALING = ResponsiveScaling()
+    return _SCALING
 
 
 # === IMAGE MANAGER CLASS ===
@@ -79,62 +136,194 @@ class ImageManager:
         self.assets_dir = Path(assets_dir)
         self.assets_dir.mkdir(exist_ok=True)
         self.api_key = api_key
+        self.api_headers = {"Authorization": f"Bearer {api_key}"}
+        
+        # Immagini locali indicizzate all'avvio: nome cartella (minuscolo) -> percorso
+        self.local_index = self._build_local_index()
+        
+        # Cache dei nomi che SteamGridDB non conosce: nome -> timestamp dell'ultimo tentativo
+        self.misses_file = self.assets_dir / "_misses.json"
+        self.miss_ttl = 7 * 86400  # 7 giorni
+        self._misses_lock = threading.Lock()
+        try:
+            with open(self.misses_file, 'r', encoding='utf-8') as f:
+                self.misses = json.load(f)
+        except (OSError, ValueError):
+            self.misses = {}
+        
+        # Thread di download creati alla prima importazione e riusati per tutte le successive
+        self._pool = None
+        self._pool_workers = 8
+        self._render_pool = None  # Decodifica/arrotondamento delle immagini scaricate, anch'esso riusato
+        
+        # Sessione unica: connessioni keep-alive riusate tra ricerca, griglie, download e app successive
+        self.session = None
+        if REQUESTS_AVAILABLE:
+            # Errori temporanei (429/5xx) ritentati con backoff, rispettando Retry-After
+            retries = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True
+            )
+            self.session = requests.Session()
+            self.session.mount('https://', HTTPAdapter(
+                pool_connections=4,  # API e CDN delle immagini
+                pool_maxsize=self._pool_workers,  # Una connessione per thread di download, nessuna scartata
+                max_retries=retries
+            ))
+        
+        # Ricerche in corso per nome app: richieste ripetute condividono lo stesso Future
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+    
+    def close(self):
+        """Chiude le connessioni HTTP della sessione e i thread di download"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+        if self._render_pool is not None:
+            self._render_pool.shutdown(wait=False)
+            self._render_pool = None
+        if self.session is not None:
+            self.session.close()
+            self.session = None
         
     def get_app_image(self, app_name, app_path):
         """
         Ottiene l'immagine per un'app.
         Cerca prima in locale, poi online se necessario.
+        Passa dal pool di download: stesse connessioni e nessuna ricerca doppia per lo stesso nome.
+        """
+        return self.get_app_image_async(app_name, app_path)[0].result()[0]
+    
+    def get_app_image_data(self, app_name, app_path, safe_name=None):
         """
+        Come get_app_image, ma restituisce (percorso, bytes).
+        I bytes ci sono solo per le immagini appena scaricate, così la UI non deve rileggerle dal disco.
+        safe_name: nome cartella già calcolato dallo scanner (opzionale).
+        """
+        if safe_name is None:
+            safe_name = self._sanitize_filename(app_name)
+        
         # 1. Cerca in locale
-        local_image = self._find_local_image(app_name)
+        local_image = self._find_local_image(app_name, safe_name)
         if local_image:
-            return str(local_image)
+            return str(local_image), None
         
         # 2. Cerca online (se API key disponibile e requests installato)
         if self.api_key and REQUESTS_AVAILABLE:
-            online_image = self._download_from_steamgriddb(app_name)
+            online_image, image_data = self._download_from_steamgriddb(app_name, safe_name)
             if online_image:
-                return str(online_image)
+                return str(online_image), image_data
         
         # 3. Fallback su icona exe
-        return app_path if app_path and os.path.exists(app_path) else None
+        return (app_path if app_path and os.path.exists(app_path) else None), None
     
-    def _find_local_image(self, app_name):
-        """Cerca immagine nella cartella assets locale"""
-        safe_name = self._sanitize_filename(app_name)
-        app_folder = self.assets_dir / safe_name
-        
-        if app_folder.exists():
-            for ext in ['.png', '.jpg', '.jpeg', '.webp']:
-                image_path = app_folder / f"banner{ext}"
-                if image_path.exists():
-                    return image_path
-                
-                image_path = app_folder / f"{safe_name}{ext}"
-                if image_path.exists():
-                    return image_path
+    def get_app_image_async(self, app_name, app_path, safe_name=None):
+        """
+        Avvia get_app_image_data sul pool di download e restituisce (future, nuovo).
+        Se per lo stesso nome c'è già una ricerca in corso restituisce quel future (nuovo=False).
+        Le immagini già in locale non occupano il pool: il future è restituito già completato.
+        """
+        if safe_name is None:
+            safe_name = self._sanitize_filename(app_name)
+        local_image = self._find_local_image(app_name, safe_name)
+        if local_image:
+            future = Future()
+            future.set_result((str(local_image), None))
+            return future, False
+        
+        with self._pending_lock:
+            future = self._pending.get(app_name)
+            if future is not None:
+                return future, False
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self._pool_workers, thread_name_prefix="image-dl")
+            future = self._pool.submit(self.get_app_image_data, app_name, app_path, safe_name)
+            self._pending[app_name] = future
+        future.add_done_callback(lambda f, name=app_name: self._forget_pending(name, f))
+        return future, True
+    
+    def render_pool(self):
+        """Pool condiviso per preparare i tile delle immagini scaricate (creato al primo uso)"""
+        with self._pending_lock:
+            if self._render_pool is None:
+                self._render_pool = ThreadPoolExecutor(
+                    max_workers=max(1, min(4, os.cpu_count() or 1)), thread_name_prefix="image-render"
+                )
+            return self._render_pool
+    
+    def _forget_pending(self, app_name, future):
+        with self._pending_lock:
+            if self._pending.get(app_name) is future:
+                del self._pending[app_name]
+    
+    def _find_local_image(self, app_name, safe_name=None):
+        """Cerca immagine nella cartella assets locale (lookup sull'indice, nessun accesso al disco)"""
+        if safe_name is None:
+            safe_name = self._sanitize_filename(app_name)
+        return self.local_index.get(safe_name.lower())
+    
+    def _build_local_index(self):
+        """Scansiona assets una sola volta e registra l'immagine preferita di ogni cartella app"""
+        index = {}
+        try:
+            with os.scandir(self.assets_dir) as it:
+                folders = [entry for entry in it if entry.is_dir()]
+        except OSError:
+            return index
         
-        return None
+        for folder in folders:
+            try:
+                with os.scandir(folder.path) as it:
+                    names = [entry.name for entry in it]
+            except OSError:
+                continue
+            image = self._pick_local_image(Path(folder.path), folder.name, names)
+            if image is not None:
+                index[folder.name.lower()] = image
+        return index
     
-    def _download_from_steamgriddb(self, app_name):
-        """Scarica immagine da SteamGridDB"""
-        if not self.api_key or not REQUESTS_AVAILABLE:
-            return None
+    @staticmethod
+    def _pick_local_image(app_folder, safe_name, names):
+        """Sceglie tra i file di una cartella app l'immagine con priorità più alta"""
+        # Stesso ordine di preferenza di prima: banner.png, <nome>.png, banner.jpg, ...
+        wanted = {}
+        for ext in ('.png', '.jpg', '.jpeg', '.webp'):
+            for stem in ('banner', safe_name):
+                wanted.setdefault(f"{stem}{ext}".lower(), len(wanted))
+        
+        best = None
+        for name in names:
+            rank = wanted.get(name.lower())
+            if rank is not None and (best is None or rank < best[0]):
+                best = (rank, name)
+        
+        return app_folder / best[1] if best else None
+    
+    def _download_from_steamgriddb(self, app_name, safe_name=None):
+        """Scarica immagine da SteamGridDB, restituisce (percorso, bytes) o (None, None)"""
+        if not self.api_key or self.session is None:
+            return None, None
+        
+        # Già cercato di recente senza risultati: niente richiesta di rete
+        if time.time() - self.misses.get(app_name, 0) < self.miss_ttl:
+            return None, None
         
         try:
-            from urllib.parse import quote
-            headers = {"Authorization": f"Bearer {self.api_key}"}
+            # NOTA: l'header resta solo sulle chiamate API, non va inviato al CDN delle immagini
+            headers = self.api_headers
             
             # 1. Cerca il gioco
             search_url = f"https://www.steamgriddb.com/api/v2/search/autocomplete/{quote(app_name)}"
-            response = requests.get(search_url, headers=headers, timeout=5)
-            
-            if response.status_code != 200:
-                return None
+            response = self.session.get(search_url, headers=headers, timeout=5)
+            response.raise_for_status()
             
             results = response.json()
             if not results.get('data'):
-                return None
+                self._record_miss(app_name)
+                return None, None
             
             game_id = results['data'][0]['id']
             
@@ -144,43 +333,123 @@ class ImageManager:
                 "dimensions": ["460x215", "920x430"],
                 "types": ["static"]
             }
-            grids_response = requests.get(grids_url, headers=headers, params=params, timeout=5)
-            
-            if grids_response.status_code != 200:
-                return None
+            grids_response = self.session.get(grids_url, headers=headers, params=params, timeout=5)
+            grids_response.raise_for_status()
             
             grids = grids_response.json()
             if not grids.get('data'):
-                return None
+                self._record_miss(app_name)
+                return None, None
             
-            # 3. Scarica la prima immagine
+            # 3. Scarica la prima immagine direttamente su disco, a blocchi
             image_url = grids['data'][0]['url']
-            image_data = requests.get(image_url, timeout=10).content
-            
-            # 4. Salva in locale
-            safe_name = self._sanitize_filename(app_name)
+            if safe_name is None:
+                safe_name = self._sanitize_filename(app_name)
             app_folder = self.assets_dir / safe_name
             app_folder.mkdir(exist_ok=True)
             
             ext = '.png' if 'png' in image_url.lower() else '.jpg'
             image_path = app_folder / f"banner{ext}"
+            part_path = image_path.with_suffix(image_path.suffix + '.part')
             
-            with open(image_path, 'wb') as f:
-                f.write(image_data)
+            # 4. Salva in un file .part e rinomina solo a download completo (mai banner troncati)
+            try:
+                with self.session.get(image_url, timeout=10, stream=True) as image_response:
+                    image_response.raise_for_status()
+                    chunks = []
+                    with open(part_path, 'wb') as f:
+                        for chunk in image_response.iter_content(64 * 1024):
+                            f.write(chunk)
+                            chunks.append(chunk)
+                os.replace(part_path, image_path)
+            except BaseException:
+                try:
+                    part_path.unlink()
+                except OSError:
+                    pass
+                raise
+            self.local_index[safe_name.lower()] = image_path
             
             print(f"✅ Downloaded image for: {app_name}")
-            return image_path
+            self._record_miss(app_name, missed=False)
+            return image_path, b"".join(chunks)
             
         except Exception as e:
             print(f"❌ Error downloading image for {app_name}: {e}")
-            return None
+            # Solo un 404 è definitivo: errori di rete, 401 o 429 non vanno messi in cache
+            if getattr(getattr(e, 'response', None), 'status_code', None) == 404:
+                self._record_miss(app_name)
+            return None, None
+    
+    def _record_miss(self, app_name, missed=True):
+        """Aggiorna la cache dei nomi senza immagine e la riscrive in modo atomico"""
+        with self._misses_lock:
+            if missed:
+                self.misses[app_name] = time.time()
+            elif self.misses.pop(app_name, None) is None:
+                return
+            
+            try:
+                fd, tmp_path = tempfile.mkstemp(dir=self.assets_dir, suffix='.tmp')
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(self.misses, f)
+                os.replace(tmp_path, self.misses_file)
+            except OSError as e:
+                print(f"⚠️ Could not save image miss cache: {e}")
     
-    def _sanitize_filename(self, name):
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _sanitize_filename(name):
         """Rimuove caratteri non validi per nomi file"""
         safe = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_'))
         return safe.strip().replace(' ', '_')
 
 
+# === PULSANTI NAVIGABILI CON JOYPAD ===
+# Stylesheet installati una volta: la selezione cambia solo la proprietà dinamica "sel"
+_CONFIRM_BTN_QSS = """
+    QPushButton {
+        background-color: #2a2a2a;
+        color: white;
+        border: 2px solid #444;
+        padding: 12px 30px;
+        border-radius: 8px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton:hover { background-color: #3a3a3a; }
+"""
+_CONFIRM_BTN_SEL_QSS = _CONFIRM_BTN_QSS + """
+    QPushButton[sel="true"] { border: 3px solid white; }
+"""
+_MENU_BTN_QSS = """
+    QPushButton {
+        background-color: #2a2a2a;
+        color: white;
+        border: 3px solid #444;
+        border-radius: 30px;
+        font-size: 24px;
+    }
+    QPushButton[sel="true"] {
+        background-color: #ffffff;
+        color: #1a1a1a;
+        border: 4px solid white;
+        font-weight: bold;
+    }
+    QPushButton:hover { background-color: #3a3a3a; }
+"""
+
+
+def select_button(buttons, index):
+    """Segna il pulsante selezionato; ripolisce solo quelli che cambiano stato"""
+    for i, btn in enumerate(buttons):
+        selected = (i == index)
+        if btn.property("sel") != selected:
+            btn.setProperty("sel", selected)
+            btn.style().unpolish(btn)
+            btn.style().polish(btn)
+
+
 # === API KEY DIALOG ===
 class ApiKeyDialog(QDialog):
     def __init__(self, current_key="", parent=None):
@@ -263,40 +532,13 @@ class ApiKeyDialog(QDialog):
         
         # Custom key handling
         self.confirm_buttons = [self.save_btn, self.cancel_btn]
+        for btn in self.confirm_buttons:
+            btn.setStyleSheet(_CONFIRM_BTN_QSS)
         self.confirm_index = [0]
         self.update_confirm_focus()
     
     def update_confirm_focus(self):
-        for i, btn in enumerate(self.confirm_buttons):
-            if i == self.confirm_index[0]:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #2a2a2a;
-                        color: white;
-                        border: 2px solid #444;
-                        padding: 12px 30px;
-                        border-radius: 8px;
-                        font-size: 14px;
-                        font-weight: bold;
-                    }
-                    QPushButton:hover {
-                        background-color: #3a3a3a;}
-                """)
-            else:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #2a2a2a;
-                        color: white;
-                        border: 2px solid #444;
-                        padding: 12px 30px;
-                        border-radius: 8px;
-                        font-size: 14px;
-                        font-weight: bold;
-
-                    }
-                    QPushButton:hover {
-                        background-color: #3a3a3a;}
-                """)
+        select_button(self.confirm_buttons, self.confirm_index[0])
     
     def keyPressEvent(self, event):
         if event.isAutoRepeat():
@@ -320,65 +562,196 @@ class ApiKeyDialog(QDialog):
 
 
 # === FUNZIONE UTILITY PER ARROTONDARE PIXMAP SENZA BORDO NERO ===
-def rounded_pixmap(original_path, width, height, radius):
-    """Restituisce un QPixmap arrotondato con sfondo trasparente e senza bordi neri"""
-    pixmap = QPixmap(original_path)
-    if pixmap.isNull():
+# Pixmap arrotondate già generate, nella QPixmapCache di Qt (limite in KB, impostato in main)
+ROUNDED_CACHE_LIMIT_KB = 128 * 1024
+
+# Copie su disco delle immagini già arrotondate, accanto a launcher_apps.json (valide tra un avvio e l'altro)
+THUMB_CACHE_DIR = Path(".launcher_cache")
+
+
+def _rounded_key(original_path, width, height, radius):
+    """Chiave QPixmapCache; con mtime un'immagine sostituita su disco non riusa la versione vecchia"""
+    try:
+        mtime = os.path.getmtime(original_path)
+    except OSError:
         return None
-    scaled = pixmap.scaled(
-        width, height,
-        Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-        Qt.TransformationMode.SmoothTransformation
-    )
-    result = QPixmap(scaled.size())
+    return f"rounded|{original_path}|{mtime}|{width}x{height}|{radius}"
+
+
+def _background_key(original_path, width, height):
+    """Chiave della cache su disco per lo sfondo già scalato a misura di schermo"""
+    try:
+        mtime = os.path.getmtime(original_path)
+    except OSError:
+        return None
+    return f"background|{original_path}|{mtime}|{width}x{height}"
+
+
+def _thumb_path(key):
+    """File PNG della cache su disco per una chiave (la chiave contiene già l'mtime dell'originale)"""
+    return THUMB_CACHE_DIR / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.png"
+
+
+def save_thumb(key, image):
+    """Salva un'immagine (tile arrotondati, sfondo) nella cache su disco (QImage: chiamabile anche dai worker)"""
+    try:
+        THUMB_CACHE_DIR.mkdir(exist_ok=True)
+        path = _thumb_path(key)
+        tmp_path = path.with_suffix('.part')
+        if image.save(str(tmp_path), "PNG"):
+            os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠️ Could not cache thumbnail: {e}")
+
+
+def rounded_pixmap(original_path, width, height, radius, load_source=None):
+    """Restituisce un QPixmap arrotondato con sfondo trasparente e senza bordi neri
+    (load_source, se indicato, fornisce il QImage sorgente già decodificato)"""
+    key = _rounded_key(original_path, width, height, radius)
+    if key is None:
+        return None
+    
+    cached = QPixmapCache.find(key)
+    if cached is not None and not cached.isNull():
+        return cached
+    
+    # Già generata in un avvio precedente
+    result = QPixmap(str(_thumb_path(key)))
+    if result.isNull():
+        source = load_source() if load_source is not None else QImage(original_path)
+        image = load_rounded_qimage(source, width, height, radius)
+        if image is None:
+            return None
+        save_thumb(key, image)
+        result = QPixmap.fromImage(image, Qt.ImageConversionFlag.NoFormatConversion)
+    QPixmapCache.insert(key, result)
+    return result
+
+
+def cache_rounded_images(original_path, images):
+    """Converte in QPixmap (thread principale) le immagini arrotondate preparate da un worker"""
+    for (width, height, radius), image in images.items():
+        key = _rounded_key(original_path, width, height, radius)
+        if key is None:
+            continue
+        cached = QPixmapCache.find(key)
+        if cached is not None and not cached.isNull():
+            continue
+        # Conversione unica: in cache (e quindi nei tile) finiscono solo QPixmap, mai QImage
+        QPixmapCache.insert(key, QPixmap.fromImage(image, Qt.ImageConversionFlag.NoFormatConversion))
+
+
+def load_rounded_qimage(source, width, height, radius):
+    """Ritaglia un QImage con angoli arrotondati; usa solo QImage, quindi va bene anche fuori dal thread UI"""
+    if source.isNull() or width <= 0 or height <= 0:
+        return None
+    
+    # Ritaglio centrale con le proporzioni del riquadro (come KeepAspectRatioByExpanding)
+    src_w, src_h = source.width(), source.height()
+    if src_w * height > src_h * width:
+        crop_w, crop_h = src_h * width / height, src_h
+    else:
+        crop_w, crop_h = src_w, src_w * height / width
+    source_rect = QRectF((src_w - crop_w) / 2, (src_h - crop_h) / 2, crop_w, crop_h)
+    
+    # Immagini molto grandi: riduzione veloce a 2x, il filtro smooth lavora poi su molti meno pixel
+    if crop_w > width * 2 and crop_h > height * 2:
+        source = source.copy(source_rect.toRect()).scaled(
+            width * 2, height * 2,
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.FastTransformation
+        )
+        source_rect = QRectF(0, 0, width * 2, height * 2)
+    
+    # Un solo disegno scalato, limitato al rettangolo arrotondato
+    result = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
     result.fill(Qt.GlobalColor.transparent)
+    clip = QPainterPath()
+    clip.addRoundedRect(QRectF(0, 0, width, height), radius, radius)
     painter = QPainter(result)
     painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-    painter.setBrush(QColor("white"))
-    painter.setPen(Qt.PenStyle.NoPen)
-    painter.drawRoundedRect(0, 0, scaled.width(), scaled.height(), radius, radius)
-    painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
-    painter.drawPixmap(0, 0, scaled)
+    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+    painter.setClipPath(clip)
+    painter.drawImage(QRectF(0, 0, width, height), source, source_rect)
     painter.end()
     return result
 
 
-class ProgramScanner(QThread):
-    """Background thread per scansionare i programmi installati SENZA download immagini"""
-    program_found = pyqtSignal(dict)
-    scan_complete = pyqtSignal()
-    progress_update = pyqtSignal(str)
+@functools.lru_cache(maxsize=16)
+def shadow_pixmap(width, height, radius, blur, alpha=180):
+    """Ombra sfocata di un rettangolo arrotondato, calcolata una volta sola per dimensione"""
+    size = QSize(width + 2 * blur, height + 2 * blur)
+    shape = QPixmap(size)
+    shape.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(shape)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(0, 0, 0, alpha))
+    painter.drawRoundedRect(QRectF(blur, blur, width, height), radius, radius)
+    painter.end()
+    
+    # Sfocatura fatta da Qt una sola volta su una scena fuori schermo
+    scene = QGraphicsScene()
+    item = QGraphicsPixmapItem(shape)
+    effect = QGraphicsBlurEffect()
+    effect.setBlurRadius(blur)
+    item.setGraphicsEffect(effect)
+    scene.addItem(item)
+    
+    image = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(image)
+    scene.render(painter, QRectF(0, 0, size.width(), size.height()), QRectF(0, 0, size.width(), size.height()))
+    painter.end()
+    return QPixmap.fromImage(image)
 
-    def __init__(self):
-        super().__init__()
+
+class _ProgramScan:
+    """Scansione dei programmi installati, eseguita in un processo separato"""
+
+    # Exe da escludere (uninstaller, setup, updater, helper...) in un'unica regex
+    _BAD_EXE_RE = re.compile(
+        r'unins|setup|install|update|launcher|crash|report|helper|service'
+        r'|background|agent|stub|bootstrap|redist',
+        re.IGNORECASE
+    )
+
+    def __init__(self, out_queue, assets_dir="assets"):
+        self._queue = out_queue
+        
+        # Indice dei collegamenti già risolti: percorso .lnk -> {'mtime', 'target'}
+        self.lnk_index_file = Path(assets_dir) / "_lnk_index.json"
+        try:
+            with open(self.lnk_index_file, 'r', encoding='utf-8') as f:
+                self.lnk_cache = json.load(f)
+        except (OSError, ValueError):
+            self.lnk_cache = {}
+        self._lnk_seen = {}
+        self._shell = None
+        
+        # Esistenza dei percorsi icona già controllati (molte voci condividono gli stessi file)
+        self._exists_cache = {}
     
     def _find_best_exe(self, directory, app_name):
         """Trova l'exe migliore in una directory usando euristiche intelligenti"""
-        if not os.path.isdir(directory):
+        try:
+            # scandir conferma già che la cartella e i file esistono: nessun stat successivo sul risultato
+            with os.scandir(directory) as it:
+                exe_files = [
+                    entry.name for entry in it
+                    if entry.name[-4:].lower() == '.exe' and entry.is_file()
+                ]
+        except OSError:
             return None
         
         try:
-            exe_files = []
-            for f in os.listdir(directory):
-                if f.lower().endswith('.exe'):
-                    exe_files.append(f)
             
             if not exe_files:
                 return None
             
-            # Filtri per escludere exe indesiderati
-            bad_keywords = [
-                'unins', 'uninst', 'uninstall', 'setup', 'install', 'update', 
-                'updater', 'launcher', 'crash', 'report', 'helper', 'service',
-                'background', 'agent', 'stub', 'bootstrap', 'redist'
-            ]
-            
             # Prima passata: rimuovi exe chiaramente sbagliati
-            good_exes = []
-            for exe in exe_files:
-                exe_lower = exe.lower()
-                if not any(bad in exe_lower for bad in bad_keywords):
-                    good_exes.append(exe)
+            bad_exe = self._BAD_EXE_RE.search
+            good_exes = [exe for exe in exe_files if not bad_exe(exe)]
             
             if not good_exes:
                 # Se abbiamo filtrato tutto, usa il primo che non è uninstaller
@@ -411,9 +784,87 @@ class ProgramScanner(QThread):
             print(f"Error finding best exe in {directory}: {e}")
             return None
 
+    def _exists(self, path):
+        """os.path.exists con cache per percorso"""
+        key = os.path.normcase(path)
+        result = self._exists_cache.get(key)
+        if result is None:
+            result = self._exists_cache[key] = os.path.exists(path)
+        return result
+
+    @staticmethod
+    def _q(subkey, name):
+        """Legge un valore dal registro, None se manca"""
+        try:
+            return winreg.QueryValueEx(subkey, name)[0]
+        except FileNotFoundError:
+            return None
+
+    def _read_uninstall_entry(self, subkey, seen_names):
+        """Estrae nome, eseguibile e icona da una chiave Uninstall"""
+        name = self._q(subkey, "DisplayName")
+        if not isinstance(name, str) or not name.strip():
+            return
+        name = name.strip()
+        if name.lower() in seen_names:
+            return
+
+        exe_path = None
+        icon_path = None
+
+        # Icona
+        val = self._q(subkey, "DisplayIcon")
+        if isinstance(val, str):
+            icon_path = val.strip('"').split(',')[0]
+
+        # Percorso eseguibile da InstallLocation
+        val = self._q(subkey, "InstallLocation")
+        if isinstance(val, str) and val.strip():
+            exe_path = self._find_best_exe(val.strip(), name)
+
+        # Fallback su UninstallString
+        if not exe_path:
+            val = self._q(subkey, "UninstallString")
+            if isinstance(val, str) and "unins" in val.lower():
+                for p in val.split('"'):
+                    if p.lower().endswith('.exe'):
+                        exe_path = self._find_best_exe(os.path.dirname(p), name)
+                        if exe_path:
+                            break
+
+        if exe_path:
+            seen_names.add(name.lower())
+            
+            self._queue.put(('progress', f"Trovato: {name}"))
+            final_icon = icon_path if icon_path and self._exists(icon_path) else exe_path
+            
+            program_data = {
+                'name': name,
+                'path': exe_path,
+                'icon': final_icon,
+                'safe_name': ImageManager._sanitize_filename(name)
+            }
+            self._queue.put(('found', program_data))
+
     def run(self):
         seen_names = set()
 
+        # Start Menu shortcuts
+        start_menu_paths = [
+            os.path.join(os.environ.get('PROGRAMDATA', ''), 'Microsoft', 'Windows', 'Start Menu', 'Programs'),
+            os.path.join(os.environ.get('APPDATA', ''), 'Microsoft', 'Windows', 'Start Menu', 'Programs'),
+            os.path.join(os.environ.get("USERPROFILE", ""), "Desktop"),
+            os.path.join(os.environ.get("PUBLIC", "C:\\Users\\Public"), "Desktop"),
+            os.environ.get("ProgramFiles"),
+            os.environ.get("ProgramFiles(x86)")
+        ]
+        start_menu_paths = [path for path in start_menu_paths if path and os.path.isdir(path)]
+        
+        # Visita delle cartelle (solo I/O) in parallelo, una per radice, mentre si legge il registro
+        walk_pool = ThreadPoolExecutor(max_workers=max(1, min(8, len(start_menu_paths))), thread_name_prefix="scan-walk")
+        walks = [walk_pool.submit(lambda root: list(self._iter_lnks(root)), path) for path in start_menu_paths]
+        walk_pool.shutdown(wait=False)
+
         registry_paths = [
             (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
             (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"),
@@ -422,114 +873,178 @@ class ProgramScanner(QThread):
 
         for hkey, path in registry_paths:
             try:
-                key = winreg.OpenKey(hkey, path)
-                for i in range(winreg.QueryInfoKey(key)[0]):
-                    try:
-                        subkey_name = winreg.EnumKey(key, i)
-                        subkey = winreg.OpenKey(key, subkey_name)
+                with winreg.OpenKey(hkey, path, 0, winreg.KEY_READ) as key:
+                    for i in range(winreg.QueryInfoKey(key)[0]):
                         try:
-                            name = winreg.QueryValueEx(subkey, "DisplayName")[0].strip()
-                        except:
-                            winreg.CloseKey(subkey)
+                            with winreg.OpenKey(key, winreg.EnumKey(key, i)) as subkey:
+                                self._read_uninstall_entry(subkey, seen_names)
+                        except OSError:
                             continue
+            except OSError:
+                continue
 
-                        exe_path = None
-                        icon_path = None
+        # Collegamenti risolti (COM) su questo thread, nell'ordine delle radici
+        for walk in walks:
+            self.scan_shortcuts(walk.result(), seen_names)
 
-                        # Icona
-                        try:
-                            val = winreg.QueryValueEx(subkey, "DisplayIcon")[0]
-                            icon_path = val.strip('"').split(',')[0]
-                        except:
-                            pass
+        self._save_lnk_index()
+        self._queue.put(('done', None))
 
-                        # Percorso eseguibile da InstallLocation
-                        try:
-                            val = winreg.QueryValueEx(subkey, "InstallLocation")[0].strip()
-                            if val:
-                                exe_path = self._find_best_exe(val, name)
-                        except:
-                            pass
-
-                        # Fallback su UninstallString
-                        if not exe_path:
-                            try:
-                                val = winreg.QueryValueEx(subkey, "UninstallString")[0]
-                                if "unins" in val.lower():
-                                    parts = val.split('"')
-                                    for p in parts:
-                                        if p.lower().endswith('.exe'):
-                                            dir_path = os.path.dirname(p)
-                                            exe_path = self._find_best_exe(dir_path, name)
-                                            if exe_path:
-                                                break
-                            except:
-                                pass
-
-                        if name and exe_path and os.path.exists(exe_path):
-                            if name.lower() not in seen_names:
-                                seen_names.add(name.lower())
-                                
-                                self.progress_update.emit(f"Trovato: {name}")
-                                final_icon = icon_path if icon_path and os.path.exists(icon_path) else exe_path
-                                
-                                program_data = {
-                                    'name': name,
-                                    'path': exe_path,
-                                    'icon': final_icon
-                                }
-                                self.program_found.emit(program_data)
-
-                        winreg.CloseKey(subkey)
-                    except:
+    def _resolve_shortcut(self, shortcut_path):
+        """Restituisce il target di un .lnk, via COM solo se il file è cambiato dall'ultima scansione"""
+        mtime = os.stat(shortcut_path).st_mtime
+        entry = self.lnk_cache.get(shortcut_path)
+        if entry and entry.get('mtime') == mtime:
+            self._lnk_seen[shortcut_path] = entry
+            return entry['target']
+        
+        if self._shell is None:
+            import win32com.client
+            self._shell = win32com.client.Dispatch("WScript.Shell")
+        target = self._shell.CreateShortCut(shortcut_path).Targetpath
+        self._lnk_seen[shortcut_path] = {'mtime': mtime, 'target': target}
+        return target
+
+    def _save_lnk_index(self):
+        """Riscrive l'indice dei collegamenti (solo quelli visti in questa scansione)"""
+        if self._lnk_seen == self.lnk_cache:
+            return
+        try:
+            self.lnk_index_file.parent.mkdir(exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.lnk_index_file.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._lnk_seen, f)
+            os.replace(tmp_path, self.lnk_index_file)
+            self.lnk_cache = self._lnk_seen
+        except OSError as e:
+            print(f"⚠️ Could not save shortcut index: {e}")
+
+    # Cartelle da non visitare: nascoste, di sistema e junction/link (evitano anche i cicli)
+    _SKIP_DIR_ATTRS = (
+        stat.FILE_ATTRIBUTE_HIDDEN | stat.FILE_ATTRIBUTE_SYSTEM | stat.FILE_ATTRIBUTE_REPARSE_POINT
+    )
+
+    def _iter_lnks(self, root, max_depth=8):
+        """Percorsi dei .lnk sotto root, visita iterativa con scandir (senza os.walk)"""
+        stack = [(root, 0)]
+        while stack:
+            directory, depth = stack.pop()
+            try:
+                it = os.scandir(directory)
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if depth < max_depth and not (
+                                getattr(entry.stat(follow_symlinks=False), 'st_file_attributes', 0)
+                                & self._SKIP_DIR_ATTRS
+                            ):
+                                stack.append((entry.path, depth + 1))
+                        elif entry.name[-4:].lower() == '.lnk':
+                            yield entry.path, entry.name
+                    except OSError:
                         continue
-                winreg.CloseKey(key)
+
+    def scan_shortcuts(self, shortcuts, seen_names):
+        for shortcut_path, file in shortcuts:
+            try:
+                target = self._resolve_shortcut(shortcut_path)
+                if target and target.lower().endswith('.exe') and self._exists(target):
+                    name = Path(file).stem
+                    if name.lower() not in seen_names:
+                        seen_names.add(name.lower())
+                        
+                        self._queue.put(('progress', f"Trovato: {name}"))
+                        
+                        program_data = {
+                            'name': name,
+                            'path': target,
+                            'icon': target,
+                            'safe_name': ImageManager._sanitize_filename(name)
+                        }
+                        self._queue.put(('found', program_data))
+            except ImportError:
+                return
             except:
                 continue
 
-        # Start Menu shortcuts
-        start_menu_paths = [
-            os.path.join(os.environ.get('PROGRAMDATA', ''), 'Microsoft', 'Windows', 'Start Menu', 'Programs'),
-            os.path.join(os.environ.get('APPDATA', ''), 'Microsoft', 'Windows', 'Start Menu', 'Programs'),
-            os.path.join(os.environ.get("USERPROFILE", ""), "Desktop"),
-            os.path.join(os.environ.get("PUBLIC", "C:\\Users\\Public"), "Desktop"),
-            os.environ.get("ProgramFiles"),
-            os.environ.get("ProgramFiles(x86)")
-        ]
-        for start_path in start_menu_paths:
-            if os.path.exists(start_path):
-                self.scan_shortcuts(start_path, seen_names)
 
-        self.scan_complete.emit()
+def _scan_programs(out_queue, assets_dir):
+    """Entry point del processo di scansione"""
+    _ProgramScan(out_queue, assets_dir).run()
 
-    def scan_shortcuts(self, directory, seen_names):
-        try:
-            import win32com.client
-            shell = win32com.client.Dispatch("WScript.Shell")
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    if file.lower().endswith('.lnk'):
-                        try:
-                            shortcut_path = os.path.join(root, file)
-                            shortcut = shell.CreateShortCut(shortcut_path)
-                            target = shortcut.Targetpath
-                            if target and target.lower().endswith('.exe') and os.path.exists(target):
-                                name = Path(file).stem
-                                if name.lower() not in seen_names:
-                                    seen_names.add(name.lower())
-                                    
-                                    self.progress_update.emit(f"Trovato: {name}")
-                                    
-                                    program_data = {
-                                        'name': name,
-                                        'path': target,
-                                        'icon': target
-                                    }
-                                    self.program_found.emit(program_data)
-                        except:
-                            continue
-        except ImportError:
-            pass
+
+class ProgramScanner(QObject):
+    """Avvia la scansione in un processo separato e ne inoltra i risultati come segnali Qt"""
+    program_found = pyqtSignal(list)  # Un blocco di programmi per ogni lettura della coda
+    scan_complete = pyqtSignal()
+    progress_update = pyqtSignal(str)
+
+    BATCH_SIZE = 64
+
+    def __init__(self, assets_dir="assets", parent=None):
+        super().__init__(parent)
+        self.assets_dir = str(assets_dir)
+        self._queue = multiprocessing.Queue()
+        self._process = None
+        self._finished = False
+        
+        # Il processo di scansione non tocca il GIL della UI: i risultati vengono letti ogni 50ms
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(50)
+        self._poll_timer.timeout.connect(self._drain)
+
+    def start(self):
+        self._process = multiprocessing.Process(
+            target=_scan_programs, args=(self._queue, self.assets_dir), daemon=True
+        )
+        self._process.start()
+        self._poll_timer.start()
+
+    def stop(self):
+        """Interrompe la scansione (es. dialog chiuso prima della fine)"""
+        self._poll_timer.stop()
+        if self._process is not None and self._process.is_alive():
+            self._process.terminate()
+
+    def _drain(self):
+        found = []
+        last_progress = None
+        done = False
+        for _ in range(self.BATCH_SIZE):
+            try:
+                kind, payload = self._queue.get_nowait()
+            except queue.Empty:
+                # Processo terminato senza 'done' (crash): chiudi comunque la scansione
+                done = self._process is not None and not self._process.is_alive()
+                break
+            
+            if kind == 'found':
+                found.append(payload)
+            elif kind == 'progress':
+                last_progress = payload
+            elif kind == 'done':
+                done = True
+                break
+        
+        # Un solo segnale per tipo a ogni tick
+        if found:
+            self.program_found.emit(found)
+        if last_progress is not None:
+            self.progress_update.emit(last_progress)
+        if done:
+            self._finish()
+
+    def _finish(self):
+        if self._finished:
+            return
+        self._finished = True
+        self._poll_timer.stop()
+        if self._process is not None:
+            self._process.join(timeout=1)
+        self.scan_complete.emit()
 
 
 class ProgramScanDialog(QDialog):
@@ -598,16 +1113,19 @@ class ProgramScanDialog(QDialog):
         self.list_widget.itemSelectionChanged.connect(self.update_add_button)
 
         # Avvia scansione SENZA ImageManager
-        self.scanner = ProgramScanner()
-        self.scanner.program_found.connect(self.add_item)
+        self.scanner = ProgramScanner(parent=self)
+        self.scanner.program_found.connect(self.add_items)
         self.scanner.scan_complete.connect(self.scan_done)
         self.scanner.progress_update.connect(self.update_progress)
         self.scanner.start()
 
-    def add_item(self, data):
-        item = QListWidgetItem(f"📦 {data['name']}")
-        item.setData(Qt.ItemDataRole.UserRole, data)
-        self.list_widget.addItem(item)
+    def add_items(self, programs):
+        self.list_widget.setUpdatesEnabled(False)
+        for data in programs:
+            item = QListWidgetItem(f"📦 {data['name']}")
+            item.setData(Qt.ItemDataRole.UserRole, data)
+            self.list_widget.addItem(item)
+        self.list_widget.setUpdatesEnabled(True)
         self.title_label.setText(f"Found {self.list_widget.count()} programs")
 
     def scan_done(self):
@@ -618,6 +1136,10 @@ class ProgramScanDialog(QDialog):
     def update_progress(self, message):
         self.progress_label.setText(message)
 
+    def done(self, result):
+        self.scanner.stop()
+        super().done(result)
+
     def filter_list(self, text):
         for i in range(self.list_widget.count()):
             item = self.list_widget.item(i)
@@ -635,70 +1157,329 @@ class ProgramScanDialog(QDialog):
 # ==================================
 # === NUOVO WORKER PER DOWNLOAD ===
 # ==================================
-class DownloadWorker(QThread):
-    """Worker thread per scaricare immagini in background"""
+class DownloadSignals(QObject):
+    """Segnali del DownloadWorker (un QRunnable non può averne di propri)"""
     progress_update = pyqtSignal(str, int) # Messaggio, percentuale
-    app_ready = pyqtSignal(dict) # Invia un'app completa
+    app_ready_batch = pyqtSignal(list) # Blocco di (app completa, {(w, h, raggio): QImage arrotondata})
     finished = pyqtSignal()
 
-    def __init__(self, selected_programs, image_manager, existing_app_names):
+
+class DownloadWorker(QRunnable):
+    """Coordina il download delle immagini su un thread del QThreadPool globale (niente QThread per ogni importazione)"""
+    BATCH_SIZE = 32  # App per ogni segnale verso il thread principale...
+    BATCH_INTERVAL = 0.05  # ...o secondi massimi di attesa per un blocco incompleto
+
+    def __init__(self, selected_programs, image_manager, existing_app_names, tile_sizes=()):
         super().__init__()
+        self.signals = DownloadSignals()
+        self._done = threading.Event()
+        self.tile_sizes = tile_sizes  # Dimensioni dei tile da preparare qui, fuori dal thread UI
         self.selected = selected_programs
         self.image_manager = image_manager
-        self.existing = existing_app_names
+        self.existing = existing_app_names  # frozenset di nomi già in minuscolo
         self.is_running = True
+        self._owned_futures = []  # Download avviati da questo worker, annullati da stop()
+        self._pending = []  # App pronte non ancora inviate al thread principale
+        self._last_flush = 0.0
+        self._last_progress = 0.0
+
+    def _emit_progress(self, message, percent, force=False):
+        """Aggiorna la barra al massimo 10 volte al secondo (sempre sugli stati finali)"""
+        now = time.monotonic()
+        if force or now - self._last_progress > 0.1:
+            self._last_progress = now
+            self.signals.progress_update.emit(message, percent)
+
+    def _prerender(self, image_path, image_data):
+        """Decodifica e arrotonda l'immagine per ogni dimensione di tile (QImage, sicuro nei thread)"""
+        if not image_path or not self.tile_sizes:
+            return {}
+        source = QImage.fromData(image_data) if image_data else QImage(image_path)
+        images = {}
+        for size in self.tile_sizes:
+            image = load_rounded_qimage(source, *size)
+            if image is not None:
+                images[size] = image
+                key = _rounded_key(image_path, *size)
+                if key is not None:
+                    save_thumb(key, image)
+        return images
+
+    @staticmethod
+    def _app_entry(prog, icon=None):
+        """Crea la voce da salvare in config senza toccare il dict della scansione (niente 'safe_name')"""
+        return {'name': prog['name'], 'path': prog['path'], 'icon': icon or prog.get('icon', '')}
+
+    def _queue_app(self, prog, images):
+        """Accoda un'app pronta, inviando il blocco ogni BATCH_INTERVAL secondi o ogni BATCH_SIZE app"""
+        self._pending.append((prog, images))
+        if len(self._pending) >= self.BATCH_SIZE or time.monotonic() - self._last_flush > self.BATCH_INTERVAL:
+            self._flush()
+
+    def _flush(self):
+        if self._pending:
+            self.signals.app_ready_batch.emit(self._pending)
+            self._pending = []
+        self._last_flush = time.monotonic()
 
     def run(self):
         # Filtra solo i programmi non già esistenti
-        to_download = []
-        for prog in self.selected:
-            if prog['name'].lower() not in self.existing:
-                 to_download.append(prog)
+        to_download = [prog for prog in self.selected if prog['name'].lower() not in self.existing]
         
         total = len(to_download)
         if total == 0:
-            self.progress_update.emit("Programs already present.", 100)
-            self.finished.emit()
+            self.signals.progress_update.emit("Programs already present.", 100)
+            self._finish()
+            return
+
+        # Senza API key non c'è niente da scaricare: un solo blocco con tutte le app
+        if not self.image_manager.api_key or not REQUESTS_AVAILABLE:
+            self.signals.app_ready_batch.emit([(self._app_entry(prog), {}) for prog in to_download])
+            self.signals.progress_update.emit("Completated!", 100)
+            self._finish()
             return
 
+        # Scarica immagini 16:9 in parallelo sul pool dell'ImageManager
+        positions = {}
         for i, prog in enumerate(to_download):
-            if not self.is_running:
-                break
-            
-            percent = int((i + 1) / total * 100)
-            self.progress_update.emit(f"Downloading: {prog['name']}...", percent)
-            
-            # Scarica immagine 16:9 (se API key c'è)
-            if self.image_manager.api_key and REQUESTS_AVAILABLE:
-                image_result = self.image_manager.get_app_image(prog['name'], prog['path'])
-                if image_result:
-                    prog['icon'] = image_result
-            
-            self.app_ready.emit(prog) # Invia l'app al thread principale
+            future, is_new = self.image_manager.get_app_image_async(
+                prog['name'], prog['path'], prog.get('safe_name')
+            )
+            positions.setdefault(future, []).append(i)
+            if is_new:
+                self._owned_futures.append(future)
+        
+        # Decodifica e arrotondamento in parallelo, appena ogni download termina
+        results = queue.Queue()
+        render_pool = self.image_manager.render_pool()
+
+        def render(future):
+            try:
+                image_result, image_data = future.result()
+            except Exception as e:
+                print(f"❌ Image lookup failed: {e}")
+                image_result, image_data = None, None
+            images = self._prerender(image_result, image_data) if self.is_running else {}
+            results.put((future, image_result, images))
+
+        def schedule_render(future):
+            try:
+                render_pool.submit(render, future)
+            except RuntimeError:
+                pass  # Pool già chiuso (launcher in chiusura)
+
+        for future in positions:
+            future.add_done_callback(schedule_render)
+        
+        completed = {}
+        next_index = 0
+        done = 0
+        remaining = len(positions)
+        try:
+            while remaining and self.is_running:
+                try:
+                    future, image_result, images = results.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                remaining -= 1
+                
+                for i in positions[future]:
+                    prog = to_download[i]
+                    done += 1
+                    completed[i] = (self._app_entry(prog, image_result), images)
+                
+                percent = int(done / total * 100)
+                self._emit_progress(f"Downloading: {prog['name']}...", percent, done == total)
+                
+                # Invia le app al thread principale nell'ordine di selezione
+                while next_index in completed:
+                    self._queue_app(*completed.pop(next_index))
+                    next_index += 1
+            self._flush()
+        finally:
+            # Interruzione anticipata: annulla i download non ancora partiti
+            for future in self._owned_futures:
+                future.cancel()
         
         if self.is_running:
-            self.progress_update.emit("Completated!", 100)
+            self.signals.progress_update.emit("Completated!", 100)
         else:
-            self.progress_update.emit("Cancel.", 100)
+            self.signals.progress_update.emit("Cancel.", 100)
             
-        self.finished.emit()
+        self._finish()
+
+    def start(self):
+        QThreadPool.globalInstance().start(self)
+
+    def isRunning(self):
+        return not self._done.is_set()
+
+    def _finish(self):
+        self._done.set()
+        self.signals.finished.emit()
 
     def stop(self):
         """Ferma il worker in modo sicuro"""
         print("Worker Interruption Requested")
         self.is_running = False
+        # Sblocca subito l'attesa in run(): i download in coda non partono più
+        for future in list(self._owned_futures):
+            future.cancel()
+
+
+class SingleAppImageSignals(QObject):
+    """Segnali del SingleAppImageWorker"""
+    finished = pyqtSignal(dict) # App completa (con l'immagine trovata, se c'è)
+
+
+class SingleAppImageWorker(QRunnable):
+    """Cerca l'immagine di una singola app aggiunta a mano, fuori dal thread UI"""
+
+    def __init__(self, image_manager, app_data):
+        super().__init__()
+        self.signals = SingleAppImageSignals()
+        self.image_manager = image_manager
+        self.app_data = app_data
+
+    def run(self):
+        app_data = self.app_data
+        print(f"📥 Searching image for: {app_data['name']}")
+        try:
+            image_result = self.image_manager.get_app_image(app_data['name'], app_data['path'])
+        except Exception as e:
+            print(f"❌ Image lookup failed: {e}")
+            image_result = None
+        if image_result:
+            app_data = dict(app_data, icon=image_result)
+            print(f"✅ Image found: {app_data['name']}")
+        else:
+            print(f"⚠️ No image found, using exe icon")
+        self.signals.finished.emit(app_data)
+
+
+class JoystickPoller(QObject):
+    """Legge il joystick su un thread dedicato e invia al thread UI solo gli stati utili"""
+    state_polled = pyqtSignal(float, float, object, object)  # Asse X, asse Y, hat (None se assente), bit dei pulsanti
+    poll_failed = pyqtSignal(str)
+
+    def __init__(self, joystick, interval_ms, deadzone, parent=None):
+        super().__init__(parent)
+        self.joystick = joystick
+        self.interval = interval_ms / 1000
+        self.deadzone = deadzone
+        self._stop = threading.Event()
+        self._resume = threading.Event()
+        self._resume.set()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="joystick-poll", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._resume.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(0.5)
+
+    def set_paused(self, paused):
+        """In pausa (app lanciata) il thread resta fermo, senza risvegli"""
+        if paused:
+            self._resume.clear()
+        else:
+            self._resume.set()
+
+    def _read(self):
+        joystick = self.joystick
+        pygame.event.pump()
+        hat = joystick.get_hat(0) if joystick.get_numhats() > 0 else None
+        buttons = 0
+        for i in range(joystick.get_numbuttons()):
+            if joystick.get_button(i):
+                buttons |= 1 << i
+        return joystick.get_axis(0), joystick.get_axis(1), hat, buttons
+
+    def _run(self):
+        idle = True
+        deadline = time.monotonic()
+        while not self._stop.is_set():
+            if not self._resume.is_set():
+                self._resume.wait()
+                idle = True
+                deadline = time.monotonic()
+                continue
+            try:
+                x_axis, y_axis, hat, buttons = self._read()
+            except Exception as e:
+                self.poll_failed.emit(str(e))
+                return
+            # A riposo non si invia nulla (solo il primo stato di riposo, per chiudere i fronti)
+            active = (buttons or hat not in (None, (0, 0))
+                      or abs(x_axis) > self.deadzone or abs(y_axis) > self.deadzone)
+            if active or not idle:
+                self.state_polled.emit(x_axis, y_axis, hat, buttons)
+            idle = not active
+            # Scadenze assolute: la cadenza non accumula il ritardo di ogni giro
+            deadline += self.interval
+            delay = deadline - time.monotonic()
+            if delay < 0:
+                deadline = time.monotonic()
+                delay = 0
+            self._stop.wait(delay)
+
+
+@functools.lru_cache(maxsize=4)
+def _tile_qss(border_radius, border_width, image_font, name_font, name_focused_font):
+    """Stylesheet dei tile, installato una volta: il focus cambia solo la proprietà dinamica 'focused'"""
+    return f"""
+        QLabel#tileImage {{
+            background-color: #1a1a1a;
+            border-radius: {border_radius}px;
+            color: #cccccc;
+            font-size: {image_font}px;
+            font-weight: 600;
+        }}
+        QLabel#tileImage[focused="true"] {{
+            border: {border_width}px solid #ffffff;
+            color: #ffffff;
+        }}
+        QLabel#tileName {{
+            color: #999999;
+            font-size: {name_font}px;
+            background: transparent;
+            border: none;
+        }}
+        QLabel#tileName[focused="true"] {{
+            color: #ffffff;
+            font-size: {name_focused_font}px;
+            font-weight: 600;
+        }}
+    """
 
 
 class AppTile(QWidget):
+    @staticmethod
+    def image_sizes(scaling):
+        """(larghezza, altezza, raggio) dell'immagine nello stato normale e in quello focused"""
+        radius = scaling.scale(24)
+        return (
+            (scaling.scale(360), scaling.scale(203), radius),
+            (scaling.scale(400), scaling.scale(225), radius),
+        )
+
     def __init__(self, app_data, scaling, parent=None):
         super().__init__(parent)
         self.app_data = app_data
         self.scaling = scaling
-        self.is_focused = False
+        self.is_focused = None  # None = stato non ancora applicato
        
         # === INIZIO OTTIMIZZAZIONE #1: CACHE PIXMAP ===
+        # None = da generare, False = immagine non disponibile (non si riprova a ogni cambio di focus)
         self._normal_pixmap = None
         self._focused_pixmap = None
+        self._source_image = None
+        self._icon_path = app_data.get('icon')
+        self._icon_exists = self._check_icon(self._icon_path)
         # === FINE OTTIMIZZAZIONE #1 ===
        
         # Dimensioni scalate
@@ -707,75 +1488,101 @@ class AppTile(QWidget):
         self.focused_width = self.scaling.scale(400)
         self.focused_height = self.scaling.scale(288)
        
-        self.normal_img_width = self.scaling.scale(360)
-        self.normal_img_height = self.scaling.scale(203)
-        self.focused_img_width = self.scaling.scale(400)
-        self.focused_img_height = self.scaling.scale(225)
-       
-        self.border_radius = self.scaling.scale(24)
+        normal_size, focused_size = self.image_sizes(self.scaling)
+        self.normal_img_width, self.normal_img_height, self.border_radius = normal_size
+        self.focused_img_width, self.focused_img_height, _ = focused_size
        
         self.setFixedSize(self.normal_width, self.normal_height)
+        self.setStyleSheet(_tile_qss(
+            self.border_radius, self.scaling.scale(3), self.scaling.scale_font(18),
+            self.scaling.scale_font(14), self.scaling.scale_font(15)
+        ))
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(8)
         self.image_label = QLabel()
+        self.image_label.setObjectName("tileImage")
+        # Niente setScaledContents: i pixmap in cache hanno già la dimensione esatta del riquadro
         self.image_label.setFixedSize(self.normal_img_width, self.normal_img_height)
-        self.image_label.setScaledContents(True)
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.image_label.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        # QLabel (QFrame) disegna già il box dello stylesheet: niente WA_StyledBackground.
+        # Non è opaco: gli angoli arrotondati del pixmap sono trasparenti.
+        self.image_label.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, False)
         
         # === OTTIMIZZAZIONE #1: Rimossa generazione pixmap da qui ===
         # La generazione è spostata in set_focused
         
-        self.image_label.setStyleSheet(f"""
-            QLabel {{
-                background-color: #1a1a1a;
-                border-radius: {self.border_radius}px;
-                color: #cccccc;
-                font-size: {self.scaling.scale_font(18)}px;
-                font-weight: 600;
-            }}
-        """)
-        
-        self.shadow = QGraphicsDropShadowEffect()
-        self.shadow.setBlurRadius(self.scaling.scale(15))
-        self.shadow.setXOffset(0)
-        self.shadow.setYOffset(self.scaling.scale(4))
-        self.shadow.setColor(QColor(0, 0, 0, 180))
-        self.image_label.setGraphicsEffect(self.shadow)
+        # Ombra pre-calcolata, disegnata dal paintEvent del tile sotto l'immagine (nessun widget in più)
+        self._shadow = None
+        self._shadow_pos = QPoint()
         layout.addWidget(self.image_label)
         
         self.name_label = QLabel(app_data['name'])
+        self.name_label.setObjectName("tileName")
         self.name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.name_label.setMaximumWidth(self.normal_width)
-        self.name_label.setStyleSheet(f"""
-            QLabel {{
-                color: #999999;
-                font-size: {self.scaling.scale_font(14)}px;
-                background: transparent;
-                border: none;
-            }}
-        """)
         layout.addWidget(self.name_label)
         self.setLayout(layout)
         
         # === OTTIMIZZAZIONE #1: Popola la cache iniziale ===
         self.set_focused(False)
 
+    def bind(self, app_data, app_index):
+        """Riusa il tile per un'altra app (carosello a tile riciclati)"""
+        same_app = app_data is self.app_data and app_data.get('icon') == self._icon_path
+        self.app_data = app_data
+        self.app_index = app_index
+        if same_app:
+            # Stessa app (es. carosello con poche app): i pixmap del tile sono ancora validi
+            self.set_focused(False)
+            return
+        
+        # Invalida i pixmap del tile: quelli della nuova app arrivano da QPixmapCache
+        self._normal_pixmap = None
+        self._focused_pixmap = None
+        self._source_image = None
+        self._icon_path = app_data.get('icon')
+        self._icon_exists = self._check_icon(self._icon_path)
+        
+        self.name_label.setText(app_data['name'])
+        self.is_focused = None
+        self.set_focused(False)
+
+    @staticmethod
+    def _check_icon(icon_path):
+        """Controlla una sola volta (per app assegnata) che l'icona esista su disco"""
+        return bool(icon_path) and os.path.exists(icon_path)
+
+    def _load_source(self):
+        """Decodifica l'icona una sola volta: le due dimensioni (normale/focus) partono dallo stesso QImage"""
+        if self._source_image is None:
+            self._source_image = QImage(self._icon_path)
+        return self._source_image
+
+    def _release_source(self):
+        """Libera l'immagine sorgente quando entrambe le dimensioni sono pronte"""
+        if self._normal_pixmap is not None and self._focused_pixmap is not None:
+            self._source_image = None
+
     def set_focused(self, focused):
+        # Stato già applicato (e nessuno stile del riordino da ripulire): niente restyle né nuovo pixmap
+        if focused == self.is_focused and not self.image_label.styleSheet():
+            return
         self.is_focused = focused
-        icon_path = self.app_data.get('icon')
+        icon_path = self._icon_path
         
         if focused:
             self.setFixedSize(self.focused_width, self.focused_height)
             self.image_label.setFixedSize(self.focused_img_width, self.focused_img_height)
             
             # === INIZIO OTTIMIZZAZIONE #1: USA CACHE FOCUSED ===
-            if self._focused_pixmap is None and icon_path and Path(icon_path).exists():
+            if self._focused_pixmap is None:
                 # Genera solo se non è in cache
-                self._focused_pixmap = rounded_pixmap(
-                    icon_path, self.focused_img_width, self.focused_img_height, self.border_radius
-                )
+                self._focused_pixmap = self._icon_exists and rounded_pixmap(
+                    icon_path, self.focused_img_width, self.focused_img_height, self.border_radius,
+                    self._load_source
+                ) or False
+                self._release_source()
             
             if self._focused_pixmap:
                 self.image_label.setPixmap(self._focused_pixmap)
@@ -783,35 +1590,21 @@ class AppTile(QWidget):
                 self.image_label.setText(self.app_data['name']) # Fallback
             # === FINE OTTIMIZZAZIONE #1 ===
             
-            self.image_label.setStyleSheet(f"""
-                QLabel {{
-                    background-color: #1a1a1a;
-                    border: {self.scaling.scale(3)}px solid #ffffff;
-                    border-radius: {self.border_radius}px;
-                    color: #ffffff;
-                    font-size: {self.scaling.scale_font(18)}px;
-                    font-weight: 600;
-                }}
-            """)
-            self.name_label.setStyleSheet(f"""
-                QLabel {{
-                    color: #ffffff;
-                    font-size: {self.scaling.scale_font(15)}px;
-                    font-weight: 600;
-                }}
-            """)
-            self.shadow.setBlurRadius(self.scaling.scale(25))
-            self.shadow.setYOffset(self.scaling.scale(8))
+            self._apply_focus_style(True)
+            self._set_shadow(self.focused_img_width, self.focused_img_height,
+                             self.scaling.scale(25), self.scaling.scale(8))
         else:
             self.setFixedSize(self.normal_width, self.normal_height)
             self.image_label.setFixedSize(self.normal_img_width, self.normal_img_height)
             
             # === INIZIO OTTIMIZZAZIONE #1: USA CACHE NORMALE ===
-            if self._normal_pixmap is None and icon_path and Path(icon_path).exists():
+            if self._normal_pixmap is None:
                 # Genera solo se non è in cache
-                self._normal_pixmap = rounded_pixmap(
-                    icon_path, self.normal_img_width, self.normal_img_height, self.border_radius
-                )
+                self._normal_pixmap = self._icon_exists and rounded_pixmap(
+                    icon_path, self.normal_img_width, self.normal_img_height, self.border_radius,
+                    self._load_source
+                ) or False
+                self._release_source()
             
             if self._normal_pixmap:
                 self.image_label.setPixmap(self._normal_pixmap)
@@ -819,23 +1612,36 @@ class AppTile(QWidget):
                 self.image_label.setText(self.app_data['name']) # Fallback
             # === FINE OTTIMIZZAZIONE #1 ===
             
-            self.image_label.setStyleSheet(f"""
-                QLabel {{
-                    background-color: #1a1a1a;
-                    border-radius: {self.border_radius}px;
-                    color: #cccccc;
-                    font-size: {self.scaling.scale_font(18)}px;
-                    font-weight: 600;
-                }}
-            """)
-            self.name_label.setStyleSheet(f"""
-                QLabel {{
-                    color: #999999;
-                    font-size: {self.scaling.scale_font(14)}px;
-                }}
-            """)
-            self.shadow.setBlurRadius(self.scaling.scale(15))
-            self.shadow.setYOffset(self.scaling.scale(4))
+            self._apply_focus_style(False)
+            self._set_shadow(self.normal_img_width, self.normal_img_height,
+                             self.scaling.scale(15), self.scaling.scale(4))
+
+    def _apply_focus_style(self, focused):
+        """Aggiorna lo stile cambiando la proprietà "focused" (nessun nuovo stylesheet da interpretare)"""
+        if self.image_label.styleSheet():
+            # Stile lasciato dalla modalità riordino: torna a quello del tile
+            self.image_label.setStyleSheet("")
+        for label in (self.image_label, self.name_label):
+            if label.property("focused") != focused:
+                label.setProperty("focused", focused)
+                label.style().unpolish(label)
+                label.style().polish(label)
+
+    def _set_shadow(self, img_width, img_height, blur, y_offset):
+        """Posiziona sotto l'immagine l'ombra già sfocata per la dimensione corrente"""
+        shadow = shadow_pixmap(img_width, img_height, self.border_radius, blur)
+        pos = QPoint(-blur, y_offset - blur)
+        if shadow is not self._shadow or pos != self._shadow_pos:
+            self._shadow = shadow
+            self._shadow_pos = pos
+            self.update()
+
+    def paintEvent(self, event):
+        # L'ombra fa parte del disegno del tile: i figli (immagine, nome) vengono dipinti sopra
+        if self._shadow is not None:
+            painter = QPainter(self)
+            painter.drawPixmap(self._shadow_pos, self._shadow)
+            painter.end()
 
 
 class SystemMenuDialog(QDialog):
@@ -881,18 +1687,7 @@ class SystemMenuDialog(QDialog):
         self.buttons.append(("close", self.close_btn))
         layout.addWidget(self.close_btn)
         for action, btn in self.buttons:
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #2a2a2a;
-                    color: white;
-                    border: 3px solid #444;
-                    border-radius: 30px;
-                    font-size: 24px;
-                }
-                
-                QPushButton:hover {
-                        background-color: #3a3a3a;}
-            """)
+            btn.setStyleSheet(_MENU_BTN_QSS)
             btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
         dialog_layout = QVBoxLayout()
         dialog_layout.setContentsMargins(0, 0, 0, 0)
@@ -901,32 +1696,7 @@ class SystemMenuDialog(QDialog):
         self.update_focus()
    
     def update_focus(self):
-        for i, (action, btn) in enumerate(self.buttons):
-            if i == self.current_index:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #ffffff;
-                        color: #1a1a1a;
-                        border: 4px solid white;
-                        border-radius: 30px;
-                        font-size: 24px;
-                        font-weight: bold;
-                    }
-                    QPushButton:hover {
-                        background-color: #3a3a3a;}
-                """)
-            else:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #2a2a2a;
-                        color: white;
-                        border: 3px solid #444;
-                        border-radius: 30px;
-                        font-size: 24px;
-                    }
-                    QPushButton:hover {
-                        background-color: #3a3a3a;}
-                """)
+        select_button([btn for _, btn in self.buttons], self.current_index)
    
     def keyPressEvent(self, event):
         if event.isAutoRepeat():
@@ -1013,38 +1783,13 @@ class EditAppDialog(QDialog):
         layout.addLayout(button_layout)
         self.setLayout(layout)
         self.confirm_buttons = [self.save_button, self.cancel_button]
+        for btn in self.confirm_buttons:
+            btn.setStyleSheet(_CONFIRM_BTN_QSS)
         self.confirm_index = [0]
         self.update_confirm_focus()
    
     def update_confirm_focus(self):
-        for i, btn in enumerate(self.confirm_buttons):
-            if i == self.confirm_index[0]:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #2a2a2a;;
-                        color: white;
-                        padding: 12px 30px;
-                        border-radius: 8px;
-                        font-size: 14px;
-                        font-weight: bold;
-                         }
-                    QPushButton:hover { background-color: #3a3a3a; }    
-                    
-                """)
-            else:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #2a2a2a;;
-                        color: white;
-                        border: 2px solid #444;
-                        padding: 12px 30px;
-                        border-radius: 8px;
-                        font-size: 14px;
-                        font-weight: bold;
-                    }
-                   QPushButton:hover { background-color: #3a3a3a; }    
-                    
-                """)
+        select_button(self.confirm_buttons, self.confirm_index[0])
    
     def keyPressEvent(self, event):
         if event.isAutoRepeat():
@@ -1142,37 +1887,13 @@ class AddAppDialog(QDialog):
         layout.addLayout(button_layout)
         self.setLayout(layout)
         self.confirm_buttons = [self.ok_button, self.cancel_button]
+        for btn in self.confirm_buttons:
+            btn.setStyleSheet(_CONFIRM_BTN_QSS)
         self.confirm_index = [0]
         self.update_confirm_focus()
    
     def update_confirm_focus(self):
-        for i, btn in enumerate(self.confirm_buttons):
-            if i == self.confirm_index[0]:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #2a2a2a;
-                        color: white;
-                        border: 2px solid #444;
-                        padding: 12px 30px;
-                        border-radius: 8px;
-                        font-size: 14px;
-                        font-weight: bold;;
-                    }
-                    QPushButton:hover { background-color: #3a3a3a;}
-                """)
-            else:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #2a2a2a;
-                        color: white;
-                        border: 2px solid #444;
-                        padding: 12px 30px;
-                        border-radius: 8px;
-                        font-size: 14px;
-                        font-weight: bold;
-                    }
-                    QPushButton:hover { background-color: #3a3a3a;}
-                """)
+        select_button(self.confirm_buttons, self.confirm_index[0])
    
     def keyPressEvent(self, event):
         if event.isAutoRepeat():
@@ -1215,34 +1936,128 @@ class AddAppDialog(QDialog):
         }
 
 
+# === AZIONI DI ALIMENTAZIONE (Win32 diretto, senza cmd.exe/shutdown.exe) ===
+_EWX_REBOOT = 0x02
+_EWX_POWEROFF = 0x08
+_EWX_FORCEIFHUNG = 0x10
+_SHTDN_REASON_FLAG_PLANNED = 0x80000000
+_TOKEN_ADJUST_PRIVILEGES = 0x0020
+_TOKEN_QUERY = 0x0008
+_SE_PRIVILEGE_ENABLED = 0x00000002
+
+
+class _LUID(ctypes.Structure):
+    _fields_ = [("LowPart", wintypes.DWORD), ("HighPart", wintypes.LONG)]
+
+
+class _LUID_AND_ATTRIBUTES(ctypes.Structure):
+    _fields_ = [("Luid", _LUID), ("Attributes", wintypes.DWORD)]
+
+
+class _TOKEN_PRIVILEGES(ctypes.Structure):
+    _fields_ = [("PrivilegeCount", wintypes.DWORD), ("Privileges", _LUID_AND_ATTRIBUTES * 1)]
+
+
+def _enable_shutdown_privilege():
+    """Abilita SeShutdownPrivilege sul token del processo (richiesto da ExitWindowsEx)"""
+    advapi32 = ctypes.WinDLL('advapi32', use_last_error=True)
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    advapi32.OpenProcessToken.argtypes = [wintypes.HANDLE, wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE)]
+    advapi32.LookupPrivilegeValueW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.POINTER(_LUID)]
+    advapi32.AdjustTokenPrivileges.argtypes = [
+        wintypes.HANDLE, wintypes.BOOL, ctypes.POINTER(_TOKEN_PRIVILEGES),
+        wintypes.DWORD, ctypes.c_void_p, ctypes.c_void_p
+    ]
+    
+    token = wintypes.HANDLE()
+    if not advapi32.OpenProcessToken(kernel32.GetCurrentProcess(),
+                                     _TOKEN_ADJUST_PRIVILEGES | _TOKEN_QUERY, ctypes.byref(token)):
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        privileges = _TOKEN_PRIVILEGES()
+        privileges.PrivilegeCount = 1
+        privileges.Privileges[0].Attributes = _SE_PRIVILEGE_ENABLED
+        if not advapi32.LookupPrivilegeValueW(None, "SeShutdownPrivilege", ctypes.byref(privileges.Privileges[0].Luid)):
+            raise ctypes.WinError(ctypes.get_last_error())
+        ctypes.set_last_error(0)
+        advapi32.AdjustTokenPrivileges(token, False, ctypes.byref(privileges), 0, None, None)
+        error = ctypes.get_last_error()  # ERROR_NOT_ALL_ASSIGNED anche se la chiamata "riesce"
+        if error:
+            raise ctypes.WinError(error)
+    finally:
+        kernel32.CloseHandle(token)
+
+
+def power_action(action):
+    """Riavvio, spegnimento o sospensione con una chiamata Win32 diretta"""
+    if action == "sleep":
+        # Stessi parametri del vecchio rundll32: niente ibernazione, forzata, eventi di risveglio attivi
+        powrprof = ctypes.WinDLL('powrprof', use_last_error=True)
+        if not powrprof.SetSuspendState(False, True, False):
+            raise ctypes.WinError(ctypes.get_last_error())
+        return
+    
+    flags = {"restart": _EWX_REBOOT, "shutdown": _EWX_POWEROFF}[action] | _EWX_FORCEIFHUNG
+    _enable_shutdown_privilege()
+    user32 = ctypes.WinDLL('user32', use_last_error=True)
+    if not user32.ExitWindowsEx(flags, _SHTDN_REASON_FLAG_PLANNED):
+        raise ctypes.WinError(ctypes.get_last_error())
+
+
 class TVLauncher(QMainWindow):
+    launched_app_exited = pyqtSignal(int)  # PID dell'app lanciata, emesso dal thread che la attende
+
     def __init__(self):
         super().__init__()
         
         # Inizializza il sistema di scaling responsive
-        self.scaling = ResponsiveScaling()
+        self.scaling = get_scaling()
         
         self.config_file = Path("launcher_apps.json")
+        self._config_save_pending = False
+        self._last_saved_config = None  # Ultimo JSON scritto: un salvataggio identico non tocca il disco
+        # Debounce: ogni save_config riavvia il timer, la scrittura parte 250ms dopo l'ultima modifica
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._flush_config)
+        # Ritorno del focus dopo dialog/ricostruzioni: più richieste nello stesso giro diventano una sola
+        self._refocus_timer = QTimer(self)
+        self._refocus_timer.setSingleShot(True)
+        self._refocus_timer.setInterval(0)
+        self._refocus_timer.timeout.connect(self._apply_refocus)
         self.config_data = self.load_config()
         self.apps = self.config_data.get('apps', [])
+        self._update_name_index()
         self.background_image = self.config_data.get('background', '')
+        self._bg_pixmap = None  # Sfondo già scalato allo schermo, disegnato in paintEvent
         self.steamgriddb_api_key = self.config_data.get('steamgriddb_api_key', '')
         self.image_manager = ImageManager(api_key=self.steamgriddb_api_key)
         self.current_index = 0
         self.tiles = []
+        self._tile_xs_cache = {}  # (numero tile, indice focused) -> ascisse
+        self._tile_pool = []  # Tile nascosti, pronti per essere riassegnati
+        self._empty_label = None
         self.menu_button_index = 0
         self.is_in_menu = False
-        self.animation_group = None
+        self.carousel_animation = None
+        self.carousel_direction = None
         self.is_animating = False
         self.joystick = None
-        self.joystick_timer = None
+        self.joystick_poller = None
         self.axis_deadzone = 0.2
         self.last_axis_state = {'x': 0, 'y': 0}
         self.last_hat = (0, 0)
-        self.button_cooldown = {}
+        self._btn_state = 0  # Bit i = pulsante i premuto all'ultimo polling
         self.axis_cooldown = 0
+        # Levetta tenuta: primo passo subito, poi ripetizione a ~10 Hz (in tick di polling)
+        self.joystick_poll_ms = 12
+        self.axis_repeat_hz = 10
+        self.axis_repeat_ticks = max(1, round(1000 / (self.axis_repeat_hz * self.joystick_poll_ms)))
         self.launched_process = None
-        self.process_check_timer = None
+        self.launched_app_exited.connect(self.on_app_closed)
         self.inputs_enabled = True
         # Quick Search Widget
         self.quick_search = QuickSearchWidget(self.scaling, self)
@@ -1251,14 +2066,15 @@ class TVLauncher(QMainWindow):
         
         # === INIZIO OTTIMIZZAZIONE #2: INIT VAR WORKER ===
         self.download_worker = None
+        self._single_app_workers = set()  # Ricerche immagine in corso per le app aggiunte a mano
         self.progress_dialog = None
-        self.added_count = 0
+        self._scan_apps = []  # App arrivate dal worker, aggiunte a self.apps in un colpo solo a fine download
         # === FINE OTTIMIZZAZIONE #2 ===
         
         if JOYSTICK_AVAILABLE:
             pygame.init()
             self.init_joystick()
-        self.joystick_detection_timer = QTimer()
+        self.joystick_detection_timer = QTimer(self)
         self.joystick_detection_timer.timeout.connect(self.detect_joystick)
         self.joystick_detection_timer.start(5000)
         self.init_ui()
@@ -1276,9 +2092,7 @@ class TVLauncher(QMainWindow):
                 self.joystick = pygame.joystick.Joystick(0)
                 self.joystick.init()
                 print(f"Joystick connected: {self.joystick.get_name()}")
-                self.joystick_timer = QTimer()
-                self.joystick_timer.timeout.connect(self.poll_joystick)
-                self.joystick_timer.start(12)
+                self._start_joystick_poller()
             
         except Exception as e:
             print(f"Error initializing joystick: {e}")
@@ -1292,38 +2106,60 @@ class TVLauncher(QMainWindow):
                     self.joystick = pygame.joystick.Joystick(0)
                     self.joystick.init()
                     print(f"Joystick connected (late detection): {self.joystick.get_name()}")
-                    if self.joystick_timer is None:
-                        self.joystick_timer = QTimer()
-                        self.joystick_timer.timeout.connect(self.poll_joystick)
-                        self.joystick_timer.start(12)
+                    if self.joystick_poller is None:
+                        self._start_joystick_poller()
             else:
                 if self.joystick is not None:
                     print("Joystick disconnected")
-                    if self.joystick_timer:
-                        self.joystick_timer.stop()
-                        self.joystick_timer = None
+                    self._stop_joystick_poller()
                     self.joystick.quit()
                     self.joystick = None
         except Exception as e:
             print(f"Error during joystick detection: {e}")
             if self.joystick is not None:
                 print("Assuming joystick disconnected due to error")
-                if self.joystick_timer:
-                    self.joystick_timer.stop()
-                    self.joystick_timer = None
+                self._stop_joystick_poller()
                 self.joystick = None
-   
-    def poll_joystick(self):
-        
 
+    def _start_joystick_poller(self):
+        self.joystick_poller = JoystickPoller(
+            self.joystick, self.joystick_poll_ms, self.axis_deadzone, parent=self
+        )
+        self.joystick_poller.state_polled.connect(self.poll_joystick)
+        self.joystick_poller.poll_failed.connect(self._on_joystick_poll_failed)
+        self.joystick_poller.set_paused(not self.inputs_enabled)
+        self.joystick_poller.start()
+
+    def _stop_joystick_poller(self):
+        if self.joystick_poller is not None:
+            self.joystick_poller.stop()
+            self.joystick_poller.deleteLater()
+            self.joystick_poller = None
+        self._btn_state = 0
+
+    def _set_joystick_paused(self, paused):
+        """Sospende lettura e rilevamento del joystick (es. durante il progress dialog dei download)"""
+        if self.joystick_poller is not None:
+            self.joystick_poller.set_paused(paused or not self.inputs_enabled)
+        if self.joystick_detection_timer is None:
+            return  # Launcher in chiusura
+        if paused:
+            self.joystick_detection_timer.stop()
+        elif not self.joystick_detection_timer.isActive():
+            self.joystick_detection_timer.start(5000)
+
+    def _on_joystick_poll_failed(self, error):
+        print(f"Joystick polling error, assuming disconnected: {error}")
+        self._stop_joystick_poller()
+        self.joystick = None
+   
+    def poll_joystick(self, x_axis: float, y_axis: float, hat, buttons: int):
+        """Stato letto dal JoystickPoller: qui (thread UI) restano solo le azioni"""
         if not self.joystick or not self.inputs_enabled:
+            self._btn_state = 0
             return
         try:
-            pygame.event.pump()
-            x_axis = self.joystick.get_axis(0)
-            y_axis = self.joystick.get_axis(1)
-            if self.joystick.get_numhats() > 0:
-                hat = self.joystick.get_hat(0)
+            if hat is not None:
                 if hat != (0, 0):
                     if self.axis_cooldown > 0:
                         self.axis_cooldown -= 1 
@@ -1346,18 +2182,26 @@ class TVLauncher(QMainWindow):
             else:
                 self.axis_cooldown = 0
                 self.last_axis_state = {'x': 0, 'y': 0}
-            for i in range(self.joystick.get_numbuttons()):
-                if self.joystick.get_button(i):
-                    self.handle_button(i)
-        except (pygame.error, ValueError) as e:
-            print(f"Joystick polling error, assuming disconnected: {e}")
-            if self.joystick_timer:
-                self.joystick_timer.stop()
-                self.joystick_timer = None
-            self.joystick = None
+            # Solo i fronti di salita: ogni pressione scatta una volta, subito, senza cooldown
+            pressed = buttons & ~self._btn_state
+            self._btn_state = buttons
+            while pressed:
+                lowest = pressed & -pressed
+                self.handle_button(lowest.bit_length() - 1)
+                pressed ^= lowest
         except Exception as e:
             print(f"Error polling joystick: {e}")
    
+    def _axis_step(self, axis, value):
+        """+1/-1 se l'asse genera un passo (nuova direzione o ripetizione), 0 se è nella deadzone"""
+        if abs(value) <= self.axis_deadzone:
+            return 0
+        last = self.last_axis_state[axis]
+        self.last_axis_state[axis] = value
+        held = last > 0 if value > 0 else last < 0
+        self.axis_cooldown = self.axis_repeat_ticks if held else 2
+        return 1 if value > 0 else -1
+
     def handle_axis(self, x_axis, y_axis):
         # Se la ricerca è aperta, gestisci navigazione
         if hasattr(self, 'quick_search') and self.quick_search.isVisible():
@@ -1369,46 +2213,25 @@ class TVLauncher(QMainWindow):
                 # Nella ricerca, X non fa nulla (solo Y per navigare)
                 self.last_axis_state['x'] = x_axis
             
-            if abs(y_axis) > self.axis_deadzone:
-                if y_axis > 0 and self.last_axis_state['y'] <= 0:
-                    self.quick_search.handle_joypad_input(Qt.Key.Key_Down)
-                    self.axis_cooldown = 2
-                elif y_axis < 0 and self.last_axis_state['y'] >= 0:
-                    self.quick_search.handle_joypad_input(Qt.Key.Key_Up)
-                    self.axis_cooldown = 2
-                self.last_axis_state['y'] = y_axis
+            step = self._axis_step('y', y_axis)
+            if step:
+                self.quick_search.handle_joypad_input(Qt.Key.Key_Down if step > 0 else Qt.Key.Key_Up)
             return
         
         # Comportamento normale launcher
         if self.axis_cooldown > 0:
             self.axis_cooldown -= 1
             return
-        if abs(x_axis) > self.axis_deadzone:
-            if x_axis > 0 and self.last_axis_state['x'] <= 0:
-                self.simulate_key_press(Qt.Key.Key_Right)
-                self.axis_cooldown = 2
-            elif x_axis < 0 and self.last_axis_state['x'] >= 0:
-                self.simulate_key_press(Qt.Key.Key_Left)
-                self.axis_cooldown = 2
-            self.last_axis_state['x'] = x_axis
-        if abs(y_axis) > self.axis_deadzone:
-            if y_axis > 0 and self.last_axis_state['y'] <= 0:
-                self.simulate_key_press(Qt.Key.Key_Down)
-                self.axis_cooldown = 2
-            elif y_axis < 0 and self.last_axis_state['y'] >= 0:
-                self.simulate_key_press(Qt.Key.Key_Up)
-                self.axis_cooldown = 2
-            self.last_axis_state['y'] = y_axis
+        step = self._axis_step('x', x_axis)
+        if step:
+            self.simulate_key_press(Qt.Key.Key_Right if step > 0 else Qt.Key.Key_Left)
+        step = self._axis_step('y', y_axis)
+        if step:
+            self.simulate_key_press(Qt.Key.Key_Down if step > 0 else Qt.Key.Key_Up)
    
     def handle_button(self, button_index):
         # Se la ricerca è aperta, gestisci input specifici
         if hasattr(self, 'quick_search') and self.quick_search.isVisible():
-            current_time = pygame.time.get_ticks()
-            if button_index in self.button_cooldown:
-                if current_time - self.button_cooldown[button_index] < 300:
-                    return
-            self.button_cooldown[button_index] = current_time
-            
             # Mappa pulsanti per la ricerca
             if button_index == 0:  # A
                 self.quick_search.handle_joypad_input(Qt.Key.Key_Return)
@@ -1419,12 +2242,6 @@ class TVLauncher(QMainWindow):
             return
         
         # Comportamento normale launcher
-        current_time = pygame.time.get_ticks()
-        if button_index in self.button_cooldown:
-            if current_time - self.button_cooldown[button_index] < 300:
-                return
-        self.button_cooldown[button_index] = current_time
-        
         if button_index == 0:
             self.simulate_key_press(Qt.Key.Key_Return)
         elif button_index == 1:
@@ -1439,39 +2256,45 @@ class TVLauncher(QMainWindow):
             self.simulate_key_press(Qt.Key.Key_Down if not self.is_in_menu else Qt.Key.Key_Up)
    
     def simulate_key_press(self, key):
-        event = QKeyEvent(QKeyEvent.Type.KeyPress, key, Qt.KeyboardModifier.NoModifier)
         active_win = QApplication.activeWindow()
-        if active_win:
+        if not active_win:
+            return
+        event = QKeyEvent(QKeyEvent.Type.KeyPress, key, Qt.KeyboardModifier.NoModifier)
+        if active_win is self:
+            # Finestra principale: chiamata diretta (passa comunque dal bridge del riordino), niente coda eventi
+            self.keyPressEvent(event)
+        else:
+            # Dialog aperti: ricevono il tasto con la loro navigazione
             QCoreApplication.postEvent(active_win, event)
    
     def disable_inputs(self):
         self.inputs_enabled = False
+        if self.joystick_poller is not None:
+            self.joystick_poller.set_paused(True)
         print("🎮 Inputs disabled - App in focus")
    
     def enable_inputs(self):
         self.inputs_enabled = True
+        if self.joystick_poller is not None:
+            self.joystick_poller.set_paused(False)
         print("🎮 Inputs enabled - Launcher in focus")
    
-    def check_launched_process(self):
-        if self.launched_process is None:
-            return
+    def _wait_launched_process(self, process):
+        """Thread di attesa: si blocca finché l'app non termina (nessun polling del PID)"""
         try:
-            process = psutil.Process(self.launched_process)
-            if not process.is_running():
-                self.on_app_closed()
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            self.on_app_closed()
+            process.wait()
+        except Exception as e:
+            print(f"⚠️ Wait on launched app failed: {e}")
+        self.launched_app_exited.emit(process.pid)
    
-    def on_app_closed(self):
+    def on_app_closed(self, pid):
+        if pid != self.launched_process:
+            return
         print("✅ App closed - Re-enabling inputs")
         self.launched_process = None
-        if self.process_check_timer:
-            self.process_check_timer.stop()
-            self.process_check_timer = None
         self.enable_inputs()
-        self.activateWindow()
         self.raise_()
-        self.setFocus()
+        self._request_refocus()
 
     def init_ui(self):
         self.setWindowTitle("TV Launcher")
@@ -1493,7 +2316,6 @@ class TVLauncher(QMainWindow):
         self.overlay = overlay
         main_widget = QWidget()
         main_widget.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        main_widget.setStyleSheet("background-color: transparent;")
         self.setCentralWidget(main_widget)
         main_layout = QVBoxLayout(main_widget)
         
@@ -1513,32 +2335,7 @@ class TVLauncher(QMainWindow):
             self.scaling.scale(43), 0
         )
         
-        from datetime import datetime
-        import locale
-        try:
-            locale.setlocale(locale.LC_TIME, '')
-        except:
-            try:
-                locale.setlocale(locale.LC_TIME, 'C')
-            except:
-                pass
-        now = datetime.now()
-        time_str = now.strftime("%H:%M")
-        time_str = now.strftime("%X")
-        try:
-            test_time = now.strftime("%p")  # Returns AM/PM if locale uses 12-hour
-            if test_time:  # If AM/PM exists, use 12-hour format
-                time_str = now.strftime("%I:%M %p")
-            else:  # Otherwise use 24-hour format
-                time_str = now.strftime("%H:%M")
-        except:
-            time_str = now.strftime("%H:%M")  # Fallback to 24-hour
-        date_str = now.strftime("%d %B %Y")
-
-        parts = date_str.split()
-        if len(parts) >= 2:
-            parts[1] = parts[1].capitalize()
-            date_str = " ".join(parts)
+        time_str, date_str = clock_strings(datetime.now())
         time_label = QLabel(time_str)
         time_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         time_label.setStyleSheet(f"""
@@ -1559,9 +2356,10 @@ class TVLauncher(QMainWindow):
         header_layout.addLayout(clock_layout)
         header_layout.addStretch()
         
-        # Stile pulsanti header scalato
-        btn_style = f"""
-            QPushButton {{
+        # Stile pulsanti header scalato: un solo stylesheet sul widget centrale, i pulsanti lo prendono dal selettore #hdrBtn
+        main_widget.setStyleSheet(f"""
+            * {{ background-color: transparent; }}
+            QPushButton#hdrBtn {{
                 background-color: rgba(255, 255, 255, 0.1);
                 color: rgba(255, 255, 255, 0.7);
                 border: none;
@@ -1570,11 +2368,11 @@ class TVLauncher(QMainWindow):
                 font-size: {self.scaling.scale_font(16)}px;
                 font-weight: 500;
             }}
-            QPushButton:hover {{
+            QPushButton#hdrBtn:hover {{
                 background-color: rgba(255, 255, 255, 0.2);
                 color: white;
             }}
-        """
+        """)
         
         # API KEY BUTTON
         api_btn = QPushButton()
@@ -1627,10 +2425,8 @@ class TVLauncher(QMainWindow):
         bg_btn.clicked.connect(self.set_background)
         header_layout.addWidget(bg_btn)
 
-        api_btn.setStyleSheet(btn_style)
-        scan_btn.setStyleSheet(btn_style)
-        add_btn.setStyleSheet(btn_style)
-        bg_btn.setStyleSheet(btn_style)
+        for btn in (api_btn, scan_btn, add_btn, bg_btn):
+            btn.setObjectName("hdrBtn")
 
 
         main_layout.addLayout(header_layout)
@@ -1646,6 +2442,21 @@ class TVLauncher(QMainWindow):
         self.tile_width = self.scaling.scale(360)
         self.tile_spacing = self.scaling.scale(17)
         
+        # Striscia che contiene tutti i tile: lo scorrimento anima solo lei (una move per frame, non una per tile).
+        # Sporge di un passo a sinistra per ospitare il tile che entra da quel lato.
+        self._strip_offset = self.tile_width + self.tile_spacing
+        # Ascissa di partenza del tile che entra da sinistra (scale(50) meno un passo, più l'offset: si annullano)
+        self._left_entry_x = self.scaling.scale(50)
+        self._tile_strip = QWidget(self.carousel_container)
+        self._tile_strip.setGeometry(
+            -self._strip_offset, 0,
+            (self.max_visible_tiles + 2) * self._strip_offset + self.scaling.scale(400), self.scaling.scale(310)
+        )
+        self.carousel_animation = QPropertyAnimation(self._tile_strip, b"pos", self)
+        self.carousel_animation.setDuration(250)
+        self.carousel_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self.carousel_animation.finished.connect(lambda: self.reposition_tiles(self.carousel_direction))
+        
         main_layout.addWidget(self.carousel_container, alignment=Qt.AlignmentFlag.AlignCenter)  # cambiato in Center per responsive
         main_layout.addSpacing(20)
         main_layout.addStretch(1)
@@ -1655,11 +2466,36 @@ class TVLauncher(QMainWindow):
         menu_layout.setContentsMargins(0, 0, 0, 20)
         menu_layout.addStretch()
         button_widget = QWidget()
+        # Pulsanti del menu: stili normale/selezionato in un solo stylesheet, il focus cambia la proprietà "sel"
+        menu_border = self.scaling.scale(2)
+        menu_radius = self.scaling.scale(25)
         button_widget.setStyleSheet(f"""
             QWidget {{
                 background-color: rgba(20, 20, 20, 0.6);
                 border-radius: {self.scaling.scale(32)}px;
             }}
+            QPushButton#menuBtn, QPushButton#menuBtnSd {{
+                background-color: rgba(255, 255, 255, 0.1);
+                color: rgba(255, 255, 255, 0.7);
+                border: {menu_border}px solid transparent;
+                border-radius: {menu_radius}px;
+                font-size: {self.scaling.scale_font(24)}px;
+                font-weight: 500;
+            }}
+            QPushButton#menuBtnSd {{
+                font-size: {self.scaling.scale_font(14)}px;
+                font-weight: 600;
+            }}
+            QPushButton#menuBtn[sel="true"], QPushButton#menuBtnSd[sel="true"] {{
+                background-color: rgba(255, 255, 255, 0.95);
+                color: #000000;
+                border: {menu_border}px solid white;
+                font-weight: 600;
+            }}
+            QPushButton#menuBtnSd[sel="true"] {{
+                font-weight: 700;
+            }}
+            QPushButton#menuBtn:hover, QPushButton#menuBtnSd:hover {{ background-color: #3a3a3a; }}
         """)
         button_layout = QHBoxLayout(button_widget)
         button_layout.setSpacing(self.scaling.scale(12))
@@ -1705,32 +2541,12 @@ class TVLauncher(QMainWindow):
         for action, btn in self.menu_buttons:
             btn.clicked.connect(lambda checked, a=action: self.execute_menu_action_direct(a))
         
-        # Stili menu scalati (separati per shutdown)
+        # Stili menu scalati (separati per shutdown) nello stylesheet di button_widget
         for action, btn in self.menu_buttons:
-            if btn == self.shutdown_btn:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: rgba(255, 255, 255, 0.1);
-                        color: rgba(255, 255, 255, 0.7);
-                        border: {self.scaling.scale(2)}px solid transparent;
-                        border-radius: {self.scaling.scale(25)}px;
-                        font-size: {self.scaling.scale_font(14)}px;
-                        font-weight: 600;
-                    }}
-                    QPushButton:hover {{ background-color: #3a3a3a; }}
-                """)
-            else:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: rgba(255, 255, 255, 0.1);
-                        color: rgba(255, 255, 255, 0.7);
-                        border: {self.scaling.scale(2)}px solid transparent;
-                        border-radius: {self.scaling.scale(25)}px;
-                        font-size: {self.scaling.scale_font(24)}px;
-                        font-weight: 500;
-                    }}
-                    QPushButton:hover {{ background-color: #3a3a3a; }}
-                """)
+            btn.setObjectName("menuBtnSd" if btn is self.shutdown_btn else "menuBtn")
+        self._menu_button_widgets = tuple(btn for action, btn in self.menu_buttons)
+        self._menu_button_count = len(self._menu_button_widgets)  # Per il wrap-around di Left/Right
+        self._style_menu_buttons(None)
         
         menu_layout.addWidget(button_widget)
         menu_layout.addStretch()
@@ -1743,33 +2559,66 @@ class TVLauncher(QMainWindow):
         """)
         instructions.setAlignment(Qt.AlignmentFlag.AlignCenter)
         main_layout.addWidget(instructions)
+        self.instructions_label = instructions
         main_layout.addSpacing(8)
         self.showFullScreen()
    
     def load_config(self):
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        return {'apps': data, 'background': '', 'steamgriddb_api_key': ''}
-                    elif isinstance(data, dict):
-                        if 'steamgriddb_api_key' not in data:
-                            data['steamgriddb_api_key'] = ''
-                        return data
-                    else:
-                        return {'apps': [], 'background': '', 'steamgriddb_api_key': ''}
-            except:
-                return {'apps': [], 'background': '', 'steamgriddb_api_key': ''}
+        try:
+            # Bytes direttamente a json: niente decodifica in modalità testo
+            data = json.loads(self.config_file.read_bytes())
+        except FileNotFoundError:
+            data = None
+        except (OSError, ValueError) as e:  # ValueError copre JSONDecodeError e UnicodeDecodeError
+            print(f"⚠️ Could not read config: {e}")
+            data = None
+        if isinstance(data, list):
+            return {'apps': data, 'background': '', 'steamgriddb_api_key': ''}
+        elif isinstance(data, dict):
+            if 'steamgriddb_api_key' not in data:
+                data['steamgriddb_api_key'] = ''
+            return data
         return {'apps': [], 'background': '', 'steamgriddb_api_key': ''}
    
+    def _update_name_index(self):
+        """Nomi delle app in minuscolo (frozenset: condivisibile con i worker senza copie)"""
+        self._apps_name_index = frozenset(app['name'].lower() for app in self.apps)
+
     def save_config(self):
-        with open(self.config_file, 'w') as f:
-            json.dump({
-                'apps': self.apps,
-                'background': self.background_image,
-                'steamgriddb_api_key': self.steamgriddb_api_key
-            }, f, indent=2)
+        # Ogni modifica alla lista delle app passa di qui: l'indice dei nomi resta allineato
+        self._update_name_index()
+        # Più modifiche ravvicinate producono una sola scrittura
+        self._config_save_pending = True
+        self._save_timer.start()
+
+    def _request_refocus(self):
+        """Riporta focus e attivazione alla finestra al prossimo giro dell'event loop (una volta sola)"""
+        self._refocus_timer.start()
+
+    def _apply_refocus(self):
+        self.setFocus()
+        self.activateWindow()
+
+    def _flush_config(self):
+        """Scrive la configurazione in modo atomico (file temporaneo + os.replace), solo se è cambiata"""
+        self._save_timer.stop()
+        if not self._config_save_pending:
+            return
+        self._config_save_pending = False
+        blob = json.dumps({
+            'apps': self.apps,
+            'background': self.background_image,
+            'steamgriddb_api_key': self.steamgriddb_api_key
+        }, indent=2).encode('utf-8')
+        if blob == self._last_saved_config:
+            return
+        tmp_path = self.config_file.with_suffix('.tmp')
+        try:
+            tmp_path.write_bytes(blob)
+            os.replace(tmp_path, self.config_file)
+            self._last_saved_config = blob
+        except OSError as e:
+            print(f"⚠️ Could not save config: {e}")
    
     def set_api_key(self):
         """Apre il dialog per impostare la API key"""
@@ -1797,28 +2646,55 @@ class TVLauncher(QMainWindow):
                         "local images and exe icons."
                     )
         
-        self.setFocus()
-        self.activateWindow()
+        self._request_refocus()
    
     def update_background(self):
+        """Decodifica e scala lo sfondo una volta sola; paintEvent si limita a disegnare il pixmap"""
+        self._bg_pixmap = None
         if self.background_image and Path(self.background_image).exists():
-            self.setStyleSheet(f"""
-                QMainWindow {{
-                    background-image: url({self.background_image.replace(chr(92), '/')});
-                    background-position: center;
-                    background-repeat: no-repeat;
-                }}
-            """)
-            if hasattr(self, 'overlay'):
-                self.overlay.setStyleSheet("background-color: rgba(0, 0, 0, 0.3);")
-        else:
+            width, height = self.width(), self.height()
+            key = _background_key(self.background_image, width, height)
+            # Già scalato in un avvio precedente: si carica direttamente la versione a misura di schermo
+            pixmap = QPixmap(str(_thumb_path(key))) if key else QPixmap()
+            if pixmap.isNull():
+                image = QImage(self.background_image)
+                if not image.isNull():
+                    image = image.scaled(
+                        width, height,
+                        Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                        Qt.TransformationMode.SmoothTransformation
+                    )
+                    # Ritaglio centrale: in cache solo i pixel visibili
+                    image = image.copy((image.width() - width) // 2, (image.height() - height) // 2, width, height)
+                    if key:
+                        save_thumb(key, image)
+                    pixmap = QPixmap.fromImage(image)
+            if not pixmap.isNull():
+                self._bg_pixmap = pixmap
+        if not self.styleSheet():
             self.setStyleSheet("""
                 QMainWindow {
                     background-color: #0f0f0f;
                 }
             """)
-            if hasattr(self, 'overlay'):
+        if hasattr(self, 'overlay'):
+            if self._bg_pixmap is not None:
+                self.overlay.setStyleSheet("background-color: rgba(0, 0, 0, 0.3);")
+            else:
                 self.overlay.setStyleSheet("background-color: transparent;")
+        self.update()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self._bg_pixmap is not None:
+            # Centrato, come il vecchio background-position: center
+            painter = QPainter(self)
+            painter.drawPixmap(
+                (self.width() - self._bg_pixmap.width()) // 2,
+                (self.height() - self._bg_pixmap.height()) // 2,
+                self._bg_pixmap
+            )
+            painter.end()
    
     def set_background(self):
         file_path, _ = QFileDialog.getOpenFileName(
@@ -1831,61 +2707,14 @@ class TVLauncher(QMainWindow):
             self.background_image = file_path
             self.save_config()
             self.update_background()
-        self.setFocus()
-        self.activateWindow()
+        self._request_refocus()
        
+    def _style_menu_buttons(self, focus_index):
+        """Evidenzia il pulsante del menu focus_index (None = nessuno); ripolisce solo quelli che cambiano"""
+        select_button(self._menu_button_widgets, -1 if focus_index is None else focus_index)
+
     def update_menu_focus(self):
-        for i, (action, btn) in enumerate(self.menu_buttons):
-            if i == self.menu_button_index:
-                if btn == self.shutdown_btn:
-                    btn.setStyleSheet(f"""
-                        QPushButton {{
-                            background-color: rgba(255, 255, 255, 0.95);
-                            color: #000000;
-                            border: {self.scaling.scale(2)}px solid white;
-                            border-radius: {self.scaling.scale(25)}px;
-                            font-size: {self.scaling.scale_font(14)}px;
-                            font-weight: 700;
-                        }}
-                        QPushButton:hover {{ background-color: #3a3a3a; }}
-                    """)
-                else:
-                    btn.setStyleSheet(f"""
-                        QPushButton {{
-                            background-color: rgba(255, 255, 255, 0.95);
-                            color: #000000;
-                            border: {self.scaling.scale(2)}px solid white;
-                            border-radius: {self.scaling.scale(25)}px;
-                            font-size: {self.scaling.scale_font(24)}px;
-                            font-weight: 600;
-                        }}
-                        QPushButton:hover {{ background-color: #3a3a3a; }}
-                    """)
-            else:
-                if btn == self.shutdown_btn:
-                    btn.setStyleSheet(f"""
-                        QPushButton {{
-                            background-color: rgba(255, 255, 255, 0.1);
-                            color: rgba(255, 255, 255, 0.7);
-                            border: {self.scaling.scale(2)}px solid transparent;
-                            border-radius: {self.scaling.scale(25)}px;
-                            font-size: {self.scaling.scale_font(14)}px;
-                            font-weight: 600;
-                        }}
-                        QPushButton:hover {{ background-color: #3a3a3a; }}
-                    """)
-                else:
-                    btn.setStyleSheet(f"""
-                        QPushButton {{
-                            background-color: rgba(255, 255, 255, 0.1);
-                            color: rgba(255, 255, 255, 0.7);
-                            border: {self.scaling.scale(2)}px solid transparent;
-                            border-radius: {self.scaling.scale(25)}px;
-                            font-size: {self.scaling.scale_font(24)}px;
-                            font-weight: 500;
-                        }}
-                        QPushButton:hover {{ background-color: #3a3a3a; }}
-                    """)
+        self._style_menu_buttons(self.menu_button_index)
    
     def execute_menu_action(self):
         action = self.menu_buttons[self.menu_button_index][0]
@@ -1938,35 +2767,11 @@ class TVLauncher(QMainWindow):
         layout.addLayout(button_layout)
         confirm_dialog.setLayout(layout)
         confirm_buttons = [yes_btn, no_btn]
+        for btn in confirm_buttons:
+            btn.setStyleSheet(_CONFIRM_BTN_SEL_QSS)
         confirm_index = [1]
         def update_confirm_focus():
-            for i, btn in enumerate(confirm_buttons):
-                if i == confirm_index[0]:
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #2a2a2a;
-                            color: white;
-                            border: 3px solid white;
-                            padding: 12px 30px;
-                            border-radius: 8px;
-                            font-size: 14px;
-                            font-weight: bold;
-                        }
-                        QPushButton:hover { background-color: #3a3a3a;}
-                    """)
-                else:
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #2a2a2a;
-                            color: white;
-                            border: 2px solid #444;
-                            padding: 12px 30px;
-                            border-radius: 8px;
-                            font-size: 14px;
-                            font-weight: bold;
-                        }
-                        QPushButton:hover { background-color: #3a3a3a;}
-                    """)
+            select_button(confirm_buttons, confirm_index[0])
         def confirm_key_handler(event):
             if event.isAutoRepeat():
                 return
@@ -1990,28 +2795,36 @@ class TVLauncher(QMainWindow):
    
     def execute_power_action(self, action):
         try:
-            if action == "restart":
-                subprocess.run(["shutdown", "/r", "/t", "0"], shell=True)
-            elif action == "shutdown":
-                subprocess.run(["shutdown", "/s", "/t", "0"], shell=True)
-            elif action == "sleep":
-                # Metodo affidabile per Windows 10/11
-                subprocess.run(["rundll32.exe", "powrprof.dll,SetSuspendState", "0,1,0"], shell=True)
+            if action in ("restart", "shutdown", "sleep"):
+                self._flush_config()  # Nessun salvataggio in attesa va perso allo spegnimento
+                power_action(action)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Impossibile eseguire {action}:\n{str(e)}")
    
    
    
     def build_infinite_carousel(self):
-        for tile in self.tiles:
-            tile.setParent(None)
-            tile.deleteLater()
-        self.tiles.clear()
+        # Aggiornamenti sospesi durante la ricostruzione: un solo repaint alla fine (setUpdatesEnabled(True) chiama update())
+        self.carousel_container.setUpdatesEnabled(False)
+        try:
+            self._build_carousel_tiles()
+        finally:
+            self.carousel_container.setUpdatesEnabled(True)
+
+    def _build_carousel_tiles(self):
+        # I tile esistenti vengono riassegnati invece di essere distrutti e ricreati
+        pool = self.tiles
+        self.tiles = []
         if not self.apps:
-            empty_label = QLabel("No apps added yet. Press '+ Add App' to get started!", self.carousel_container)
-            empty_label.setStyleSheet("color: #666; font-size: 18px;")
-            empty_label.move(0, 100)
+            self._release_tiles(pool)
+            if self._empty_label is None:
+                self._empty_label = QLabel("No apps added yet. Press '+ Add App' to get started!", self.carousel_container)
+                self._empty_label.setStyleSheet("color: #666; font-size: 18px;")
+                self._empty_label.move(0, 100)
+            self._empty_label.show()
             return
+        if self._empty_label is not None:
+            self._empty_label.hide()
         if self.current_index >= len(self.apps):
             self.current_index = 0
         num_apps = len(self.apps)
@@ -2019,8 +2832,7 @@ class TVLauncher(QMainWindow):
         # Se ci sono 5 o meno app, mostra solo quelle senza ripetizioni
         if num_apps <= 5:
             for i in range(num_apps):
-                tile = AppTile(self.apps[i], self.scaling, self.carousel_container)
-                tile.app_index = i
+                tile = self._bind_tile(pool, i)
                 is_focused = (i == self.current_index)
                 tile.set_focused(is_focused)
                 self.tiles.append(tile)
@@ -2030,49 +2842,67 @@ class TVLauncher(QMainWindow):
             for i in range(self.max_visible_tiles):
                 app_offset = i - center_tile_index
                 app_idx = (self.current_index + app_offset) % num_apps
-                tile = AppTile(self.apps[app_idx], self.scaling, self.carousel_container)
-                tile.app_index = app_idx
+                tile = self._bind_tile(pool, app_idx)
                 is_focused = (i == center_tile_index)
                 tile.set_focused(is_focused)
                 self.tiles.append(tile)
+        self._release_tiles(pool)
         
         self._position_all_tiles()
         for tile in self.tiles:
             tile.show()
-        current_app = self.apps[self.current_index]
    
+    def update_carousel_entry(self, app_idx):
+        """Riassegna l'app modificata ai soli tile che la mostrano, senza ricostruire il carosello"""
+        for tile in self.tiles:
+            if tile.app_index == app_idx:
+                focused = tile.is_focused
+                tile.bind(self.apps[app_idx], app_idx)
+                tile.set_focused(focused)
+
+    def _bind_tile(self, pool, app_idx):
+        """Prende un tile dal carosello precedente o dal pool (o ne crea uno) e lo assegna all'app app_idx"""
+        if pool or self._tile_pool:
+            tile = pool.pop(0) if pool else self._tile_pool.pop()
+            tile.bind(self.apps[app_idx], app_idx)
+            return tile
+        tile = AppTile(self.apps[app_idx], self.scaling, self._tile_strip)
+        tile.app_index = app_idx
+        return tile
+
+    def _release_tiles(self, tiles):
+        """Nasconde i tile non più necessari e li tiene nel pool per le ricostruzioni successive"""
+        for tile in tiles:
+            tile.hide()
+        self._tile_pool.extend(tiles)
+        tiles.clear()
+
+    def _tile_xs(self, count: int, focus_index: int):
+        """Ascisse (nella striscia) dei tile: la focused è più larga; calcolate una volta per combinazione"""
+        key = (count, focus_index)
+        xs = self._tile_xs_cache.get(key)
+        if xs is None:
+            x_pos = self.scaling.scale(5) + self._strip_offset  # Margine sinistro
+            xs = []
+            for i in range(count):
+                xs.append(x_pos)
+                if i == focus_index:
+                    x_pos += self.focused_width + self.tile_spacing
+                else:
+                    x_pos += self.normal_width + self.tile_spacing
+            xs = self._tile_xs_cache[key] = tuple(xs)
+        return xs
+
     def _position_all_tiles(self):
         if not self.tiles:
             return
         
-        num_apps = len(self.apps)
-        
-        # Con 5 o meno app, allinea a sinistra con la focused per prima
-        if num_apps <= 5:
-            # MODIFICATO: Inizia dal margine sinistro invece del centro
-            start_x = self.scaling.scale(5)  # Margine sinistro
-            
-            x_pos = int(start_x)
-            for i, tile in enumerate(self.tiles):
-                tile.move(int(x_pos), 0)
-                # Usa la larghezza effettiva della tile (normale o focused)
-                if i == self.current_index:
-                    x_pos += self.focused_width + self.tile_spacing
-                else:
-                    x_pos += self.normal_width + self.tile_spacing
-        else:
-            # MODIFICATO: Usa la logica originale ma adattata per left alignment
-            center_tile_index = 0
-            
-            # Posizione iniziale: margine sinistro
-            start_x = self.scaling.scale(5)
-            
-            x_pos = int(start_x)
-            for i, tile in enumerate(self.tiles):
-                tile.move(int(x_pos), 0)
-                x_pos += tile.width() + self.tile_spacing
+        # Con 5 o meno app la focused è quella corrente, altrimenti sempre la prima a sinistra
+        focus_index = self.current_index if len(self.apps) <= 5 else 0
+        for x_pos, tile in zip(self._tile_xs(len(self.tiles), focus_index), self.tiles):
+            tile.move(x_pos, 0)
    
-    def animate_carousel(self, direction):
+    def animate_carousel(self, direction: str):
         if self.is_animating or not self.tiles:
             return
         
@@ -2095,42 +2925,27 @@ class TVLauncher(QMainWindow):
             # We need to reuse the rightmost tile (last in array)
             last_tile = self.tiles[-1]  # Get reference but don't remove yet
             new_app_idx = self.current_index % num_apps
-            last_tile.app_data = self.apps[new_app_idx]
-            last_tile.app_index = new_app_idx
-            
-            # Invalida cache pixmap
-            last_tile._normal_pixmap = None
-            last_tile._focused_pixmap = None
-            
-            last_tile.name_label.setText(self.apps[new_app_idx]['name'])
-            last_tile.set_focused(False)
+            last_tile.bind(self.apps[new_app_idx], new_app_idx)
             
             # Position it OFF-SCREEN to the left BEFORE moving it
-            start_x = self.scaling.scale(50)
-            last_tile.move(int(start_x - shift_distance), 0)
+            last_tile.move(self._left_entry_x, 0)
             
             # Now remove from end and insert at beginning
             self.tiles.pop()
             self.tiles.insert(0, last_tile)
         
-        self.animation_group = QParallelAnimationGroup()
-        for tile in self.tiles:
-            anim = QPropertyAnimation(tile, b"pos")
-            anim.setDuration(250)
-            anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-            start_pos = tile.pos()
-            if direction == "right":
-                end_pos = QPoint(start_pos.x() - shift_distance, start_pos.y())
-            else:
-                end_pos = QPoint(start_pos.x() + shift_distance, start_pos.y())
-            anim.setStartValue(start_pos)
-            anim.setEndValue(end_pos)
-            self.animation_group.addAnimation(anim)
-        
-        self.animation_group.finished.connect(lambda: self.reposition_tiles(direction))
-        self.animation_group.start()
+        # Una sola animazione: la striscia scorre, i tile restano fermi al suo interno
+        self.carousel_direction = direction
+        rest_pos = QPoint(-self._strip_offset, 0)
+        if direction == "right":
+            end_pos = QPoint(rest_pos.x() - shift_distance, 0)
+        else:
+            end_pos = QPoint(rest_pos.x() + shift_distance, 0)
+        self.carousel_animation.setStartValue(rest_pos)
+        self.carousel_animation.setEndValue(end_pos)
+        self.carousel_animation.start()
 
-    def reposition_tiles(self, direction):
+    def reposition_tiles(self, direction: str):
         """Riposiziona le tiles dopo l'animazione del carosello infinito"""
         num_apps = len(self.apps)
         center_tile_index = 0  # Focus is now on the left
@@ -2139,35 +2954,21 @@ class TVLauncher(QMainWindow):
             # Moving right: remove leftmost tile, add new one to the right
             first_tile = self.tiles.pop(0)
             new_app_idx = (self.current_index + (self.max_visible_tiles - 1)) % num_apps
-            first_tile.app_data = self.apps[new_app_idx]
-            first_tile.app_index = new_app_idx
-            
-            # Invalida cache pixmap
-            first_tile._normal_pixmap = None
-            first_tile._focused_pixmap = None
-            
-            first_tile.name_label.setText(self.apps[new_app_idx]['name'])
-            first_tile.set_focused(False)
+            first_tile.bind(self.apps[new_app_idx], new_app_idx)
             self.tiles.append(first_tile)
         else:
             # Moving left: tile was already repositioned in animate_carousel
             # We need to update the rightmost tile for the next scroll
             last_tile = self.tiles[-1]
             new_app_idx = (self.current_index + (self.max_visible_tiles - 1)) % num_apps
-            last_tile.app_data = self.apps[new_app_idx]
-            last_tile.app_index = new_app_idx
-            
-            # Invalida cache pixmap
-            last_tile._normal_pixmap = None
-            last_tile._focused_pixmap = None
-            
-            last_tile.name_label.setText(self.apps[new_app_idx]['name'])
-            last_tile.set_focused(False)
+            last_tile.bind(self.apps[new_app_idx], new_app_idx)
             
         for i, tile in enumerate(self.tiles):
             tile.set_focused(i == center_tile_index)
             
+        # Tile riposizionati e striscia riportata a riposo nello stesso giro: un solo ridisegno
         self._position_all_tiles()
+        self._tile_strip.move(-self._strip_offset, 0)
         self.is_animating = False
 
     # === INIZIO OTTIMIZZAZIONE #2: METODI WORKER ===
@@ -2177,12 +2978,11 @@ class TVLauncher(QMainWindow):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             selected = dialog.get_selected()
             if not selected:
-                self.setFocus()
-                self.activateWindow()
+                self._request_refocus()
                 return
 
             # --- NUOVA GESTIONE THREAD ---
-            self.added_count = 0 # Resetta il contatore
+            self._scan_apps = []
             self.progress_dialog = QProgressDialog("Image Searching in progress...", "Cancel", 0, 100, self)
             self.progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
             self.progress_dialog.setWindowTitle("Adding programs")
@@ -2221,29 +3021,31 @@ class TVLauncher(QMainWindow):
                 QPushButton:hover { background-color: #3a3a3a; }
             """)
 
-            existing_names = {app['name'].lower() for app in self.apps}
-            
-            self.download_worker = DownloadWorker(selected, self.image_manager, existing_names)
-            self.download_worker.app_ready.connect(self._on_app_ready_from_scan)
-            self.download_worker.progress_update.connect(self._on_download_progress)
-            self.download_worker.finished.connect(self._on_download_finished)
+            self.download_worker = DownloadWorker(
+                selected, self.image_manager, self._apps_name_index, AppTile.image_sizes(self.scaling)
+            )
+            self.download_worker.signals.app_ready_batch.connect(self._on_apps_ready_from_scan)
+            self.download_worker.signals.progress_update.connect(self._on_download_progress)
+            self.download_worker.signals.finished.connect(self._on_download_finished)
             
             # Connetti il pulsante "Annulla"
             self.progress_dialog.canceled.connect(self.download_worker.stop) 
             
             self.download_worker.start()
+            self._set_joystick_paused(True)  # Dialog modale: nessun input da leggere fino alla fine
             self.progress_dialog.show()
             # --- FINE GESTIONE THREAD ---
             
         else:
             # L'utente ha chiuso il ProgramScanDialog
-            self.setFocus()
-            self.activateWindow()   
-
-    def _on_app_ready_from_scan(self, app_data):
-        """Chiamato dal worker per ogni app pronta"""
-        self.apps.append(app_data)
-        self.added_count += 1
+            self._request_refocus()
+
+    def _on_apps_ready_from_scan(self, batch: list):
+        """Chiamato dal worker per ogni blocco di app pronte"""
+        for app_data, images in batch:
+            if images:
+                cache_rounded_images(app_data['icon'], images)
+        self._scan_apps += [app_data for app_data, images in batch]
     
     def _on_download_progress(self, message, percent):
         """Aggiorna il progress dialog"""
@@ -2253,25 +3055,28 @@ class TVLauncher(QMainWindow):
 
     def _on_download_finished(self):
         """Chiamato al termine di tutti i download"""
+        self._set_joystick_paused(False)
         if self.progress_dialog:
             self.progress_dialog.close()
             self.progress_dialog = None
-            
+        
+        # Una sola estensione della lista (dimensione nota) e una sola ricostruzione del carosello
+        added_count = len(self._scan_apps)
+        self.apps.extend(self._scan_apps)
+        self._scan_apps = []
         self.save_config()
         self.build_infinite_carousel()
         
         # Mostra messaggio solo se il worker non è stato annullato
         if self.download_worker and self.download_worker.is_running:
-            if self.added_count > 0:
-                QMessageBox.information(self, "Done!", f"Added {self.added_count} program(s) successfully!")
+            if added_count > 0:
+                QMessageBox.information(self, "Done!", f"Added {added_count} program(s) successfully!")
             else:
                 QMessageBox.information(self, "Info", "No new program added (may be already present).")
 
         self.download_worker = None # Pulisci il riferimento al worker
-        self.added_count = 0 # Resetta contatore
         
-        self.setFocus()
-        self.activateWindow()
+        self._request_refocus()
     # ==========================================
     # === FINE OTTIMIZZAZIONE #2: METODI WORKER ===
     # ==========================================
@@ -2281,27 +3086,25 @@ class TVLauncher(QMainWindow):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             app_data = dialog.get_app_data()
             if app_data['name'] and app_data['path']:
-                # NOTA: Questo download è ancora bloccante (come nell'originale)
-                # Per ottimizzare anche questo, servirebbe un worker separato
-                # per la singola app. Per ora rimane così.
                 if (not app_data['icon'] or app_data['icon'] == app_data['path']) and self.image_manager.api_key and REQUESTS_AVAILABLE:
-                    print(f"📥 Searching image for: {app_data['name']}")
-                    
-                    image_result = self.image_manager.get_app_image(app_data['name'], app_data['path'])
-                    if image_result:
-                        app_data['icon'] = image_result
-                        print(f"✅ Image found: {app_data['name']}")
-                    else:
-                        print(f"⚠️ No image found, using exe icon")
-                
-                self.apps.append(app_data)
-                self.save_config()
-                self.build_infinite_carousel()
+                    # Ricerca immagine sul QThreadPool: l'app arriva in _on_single_app_ready
+                    worker = SingleAppImageWorker(self.image_manager, app_data)
+                    worker.signals.finished.connect(lambda app, w=worker: self._on_single_app_ready(app, w))
+                    self._single_app_workers.add(worker)
+                    QThreadPool.globalInstance().start(worker)
+                else:
+                    self._on_single_app_ready(app_data)
             else:
                 QMessageBox.warning(self, "Invalid Input", "Please provide at least a name and executable path.")
-        self.setFocus()
-        self.activateWindow()
+        self._request_refocus()
    
+    def _on_single_app_ready(self, app_data, worker=None):
+        """Aggiunge al carosello un'app inserita a mano (subito o a ricerca immagine conclusa)"""
+        self._single_app_workers.discard(worker)
+        self.apps.append(app_data)
+        self.save_config()
+        self.build_infinite_carousel()
+
     def edit_current_app(self):
         if not self.apps:
             return
@@ -2311,11 +3114,10 @@ class TVLauncher(QMainWindow):
             if app_data['name'] and app_data['path']:
                 self.apps[self.current_index] = app_data
                 self.save_config()
-                self.build_infinite_carousel() # Ricostruisce e rigenera le cache
+                self.update_carousel_entry(self.current_index)  # Solo i tile di questa app
             else:
                 QMessageBox.warning(self, "Invalid Input", "Please provide at least a name and executable path.")
-        self.setFocus()
-        self.activateWindow()
+        self._request_refocus()
    
     def remove_current_app(self):
         if not self.apps:
@@ -2350,10 +3152,22 @@ class TVLauncher(QMainWindow):
         }
       """)
 
-        reply = msg_box.exec()
+        # open() invece di exec(): nessun event loop annidato, la risposta arriva con finished
+        app_data = self.apps[self.current_index]
+        msg_box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        msg_box.finished.connect(lambda _result: self._do_remove(msg_box, app_data))
+        msg_box.open()
 
-        if reply == QMessageBox.StandardButton.Yes:
-           self.apps.pop(self.current_index)
+    def _do_remove(self, msg_box, app_data):
+        """Rimuove l'app se l'utente ha confermato il dialog di remove_current_app"""
+        if msg_box.standardButton(msg_box.clickedButton()) != QMessageBox.StandardButton.Yes:
+            return
+        if self.current_index < len(self.apps) and self.apps[self.current_index] is app_data:
+            self.apps.pop(self.current_index)
+        elif any(app is app_data for app in self.apps):
+            self.apps.remove(app_data)
+        else:
+            return
         if self.current_index >= len(self.apps) and self.apps:
             self.current_index = len(self.apps) - 1
         elif not self.apps:
@@ -2366,12 +3180,25 @@ class TVLauncher(QMainWindow):
             return
         app = self.apps[self.current_index]
         try:
-            process = subprocess.Popen(app['path'], shell=True)
+            path = app['path']
+            if path.lower().endswith('.exe') and os.path.isfile(path):
+                # Eseguibile diretto: niente cmd.exe intermedio, il PID seguito è quello dell'app
+                process = subprocess.Popen([path])
+            elif '://' in path or os.path.exists(path):
+                # Collegamenti e URL (steam://...): ShellExecute diretto, senza cmd.exe.
+                # Non c'è un PID da seguire (come prima, quando cmd.exe usciva subito): input restano attivi
+                os.startfile(path)
+                print(f"🚀 Launched: {app['name']}")
+                return
+            else:
+                # Comandi con argomenti passano ancora dalla shell
+                process = subprocess.Popen(path, shell=True)
             self.launched_process = process.pid
             self.disable_inputs()
-            self.process_check_timer = QTimer()
-            self.process_check_timer.timeout.connect(self.check_launched_process)
-            self.process_check_timer.start(1000)
+            threading.Thread(
+                target=self._wait_launched_process, args=(process,),
+                name="app-wait", daemon=True
+            ).start()
             print(f"🚀 Launched: {app['name']} (PID: {process.pid})")
         except Exception as e:
             QMessageBox.critical(self, "Launch Error", f"Could not launch app:\n{str(e)}")
@@ -2411,34 +3238,10 @@ class TVLauncher(QMainWindow):
         elif key == Qt.Key.Key_Up:
             if self.is_in_menu:
                 self.is_in_menu = False
-                for action, btn in self.menu_buttons:
-                    if btn == self.shutdown_btn:
-                        btn.setStyleSheet(f"""
-                            QPushButton {{
-                                background-color: rgba(255, 255, 255, 0.1);
-                                color: rgba(255, 255, 255, 0.7);
-                                border: {self.scaling.scale(2)}px solid transparent;
-                                border-radius: {self.scaling.scale(25)}px;
-                                font-size: {self.scaling.scale_font(14)}px;
-                                font-weight: 600;
-                            }}
-                            QPushButton:hover {{ background-color: #3a3a3a; }}
-                        """)
-                    else:
-                        btn.setStyleSheet(f"""
-                            QPushButton {{
-                                background-color: rgba(255, 255, 255, 0.1);
-                                color: rgba(255, 255, 255, 0.7);
-                                border: {self.scaling.scale(2)}px solid transparent;
-                                border-radius: {self.scaling.scale(25)}px;
-                                font-size: {self.scaling.scale_font(24)}px;
-                                font-weight: 500;
-                            }}
-                            QPushButton:hover {{ background-color: #3a3a3a; }}
-                        """)
+                self._style_menu_buttons(None)
         elif key == Qt.Key.Key_Right:
             if self.is_in_menu:
-                self.menu_button_index = (self.menu_button_index + 1) % len(self.menu_buttons)
+                self.menu_button_index = (self.menu_button_index + 1) % self._menu_button_count
                 self.update_menu_focus()
             elif self.apps and not self.is_animating:
                 num_apps = len(self.apps)
@@ -2453,7 +3256,7 @@ class TVLauncher(QMainWindow):
                     self.animate_carousel("right")
         elif key == Qt.Key.Key_Left:
             if self.is_in_menu:
-                self.menu_button_index = (self.menu_button_index - 1) % len(self.menu_buttons)
+                self.menu_button_index = (self.menu_button_index - 1) % self._menu_button_count
                 self.update_menu_focus()
             elif self.apps and not self.is_animating:
                 num_apps = len(self.apps)
@@ -2480,31 +3283,7 @@ class TVLauncher(QMainWindow):
         elif key == Qt.Key.Key_Escape:
             if self.is_in_menu:
                 self.is_in_menu = False
-                for action, btn in self.menu_buttons:
-                    if btn == self.shutdown_btn:
-                        btn.setStyleSheet(f"""
-                            QPushButton {{
-                                background-color: rgba(255, 255, 255, 0.1);
-                                color: rgba(255, 255, 255, 0.7);
-                                border: {self.scaling.scale(2)}px solid transparent;
-                                border-radius: {self.scaling.scale(25)}px;
-                                font-size: {self.scaling.scale_font(14)}px;
-                                font-weight: 600;
-                            }}
-                            QPushButton:hover {{ background-color: #3a3a3a; }}
-                        """)
-                    else:
-                        btn.setStyleSheet(f"""
-                            QPushButton {{
-                                background-color: rgba(255, 255, 255, 0.1);
-                                color: rgba(255, 255, 255, 0.7);
-                                border: {self.scaling.scale(2)}px solid transparent;
-                                border-radius: {self.scaling.scale(25)}px;
-                                font-size: {self.scaling.scale_font(24)}px;
-                                font-weight: 500;
-                            }}
-                            QPushButton:hover {{ background-color: #3a3a3a; }}
-                        """)
+                self._style_menu_buttons(None)
             else:
                 self.close()
         else:
@@ -2524,33 +3303,40 @@ class TVLauncher(QMainWindow):
            self.build_infinite_carousel()
     
         self.enable_inputs()
-        self.setFocus()
-        self.activateWindow()
+        self._request_refocus()
 
     def on_search_closed(self):
         """Gestisce la chiusura della ricerca"""
         self.enable_inputs()
-        self.setFocus()
-        self.activateWindow()        
+        self._request_refocus()
    
     def closeEvent(self, event):
+        self._flush_config()  # Salvataggio ancora in attesa del timer
         # Assicurati di fermare il worker se è in esecuzione
         if self.download_worker and self.download_worker.isRunning():
+            # Attende il segnale finished invece di bloccare il thread UI (max 1 secondo)
+            signals = self.download_worker.signals
+            signals.finished.disconnect(self._on_download_finished)  # Niente carosello/popup in chiusura
+            loop = QEventLoop()
+            signals.finished.connect(loop.quit)
+            QTimer.singleShot(1000, loop.quit)
             self.download_worker.stop()
-            self.download_worker.wait(1000) # Aspetta max 1 secondo
+            if self.download_worker.isRunning():
+                loop.exec()
             
-        if self.process_check_timer:
-            self.process_check_timer.stop()
-        if self.joystick_timer:
-            self.joystick_timer.stop()
+        self._stop_joystick_poller()
         if self.joystick_detection_timer:
             self.joystick_detection_timer.stop()
+            self.joystick_detection_timer.deleteLater()
+            self.joystick_detection_timer = None
         if JOYSTICK_AVAILABLE:
             pygame.quit()
+        self.image_manager.close()
         event.accept()
 
 def main():
     app = QApplication(sys.argv)
+    QPixmapCache.setCacheLimit(ROUNDED_CACHE_LIMIT_KB)
     # Prova a impostare un'icona (assicurati che il percorso sia corretto)
     icon_path = "assets/icons/logo48.png"
     if Path(icon_path).exists():
@@ -2565,4 +3351,5 @@ def main():
     sys.exit(app.exec())
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()
     main()
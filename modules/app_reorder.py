@@ -5,9 +5,12 @@ Handles drag-and-drop style reordering with keyboard/joypad controls
 Save this file as 'app_reorder.py' in the same directory as tvlauncher.py
 """
 
-from PyQt6.QtWidgets import QWidget, QLabel
+from PyQt6.QtWidgets import QApplication, QLabel
 from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QColor, QImage, QPixmap
+import os
 import time
+from functools import lru_cache
 
 try:
     import pygame
@@ -15,6 +18,63 @@ try:
 except ImportError:
     PYGAME_AVAILABLE = False
 
+# Status prints are off unless TVLAUNCHER_DEBUG is set (stdout may be a slow journaled log)
+DEBUG = bool(os.environ.get('TVLAUNCHER_DEBUG'))
+
+# Keys owned by reorder mode while it is active
+_REORDER_KEYS = frozenset((
+    Qt.Key.Key_R, Qt.Key.Key_Left, Qt.Key.Key_Right,
+    Qt.Key.Key_Return, Qt.Key.Key_Enter, Qt.Key.Key_Escape,
+))
+
+# Label stylesheet templates: font size, padding, border radius, border width
+_INSTR_QSS = """
+    QLabel {
+        background-color: rgba(30, 30, 30, 0.95);
+        color: white;
+        font-size: %dpx;
+        font-weight: bold;
+        padding: %dpx;
+        border-radius: %dpx;
+        border: %dpx solid white;
+    }
+"""
+# Tile stylesheet template: border width, border color, border radius, text color, font size
+_TILE_QSS = """
+    QLabel {
+        background-color: #1a1a1a;
+        border: %dpx solid %s;
+        border-radius: %dpx;
+        color: %s;
+        font-size: %dpx;
+        font-weight: 600;
+    }
+"""
+
+# (border color, text color) per reorder role: selected gold, target blue, normal grey
+_ROLE_COLORS = {
+    'selected': ('#FFD700', '#ffffff'),
+    'target': ('#00BFFF', '#ffffff'),
+    'normal': ('#444', '#cccccc'),
+}
+_POS_LABEL_QSS = """
+    QLabel {
+        background-color: rgba(0, 0, 0, 0.8);
+        color: white;
+        font-size: %dpx;
+        font-weight: bold;
+        padding: %dpx;
+        border-radius: %dpx;
+        border: %dpx solid white;
+    }
+"""
+
+@lru_cache(maxsize=64)
+def _tile_role_style(role, border_radius, border_width, font_size):
+    """Returns the tile stylesheet for a reorder role, built once per size combination"""
+    border_color, text_color = _ROLE_COLORS[role]
+    return _TILE_QSS % (border_width, border_color, border_radius, text_color, font_size)
+
 
 class ReorderMode:
     """Manages the reordering state and UI feedback"""
@@ -29,13 +89,43 @@ class ReorderMode:
         self.long_press_timer = QTimer()
         self.long_press_timer.timeout.connect(self._activate_reorder)
         self.long_press_duration = 800  # ms to hold before activating
+
+        # Single reusable timer for the post-animation refresh (coalesces rapid moves)
+        self._post_anim_timer = QTimer()
+        self._post_anim_timer.setSingleShot(True)
+        self._post_anim_timer.timeout.connect(self._refresh_after_carousel_move)
+
+        # Batches rapid carousel moves into a single slide (signed number of steps)
+        self._pending_delta = 0
+        self._batch_timer = QTimer()
+        self._batch_timer.setSingleShot(True)
+        self._batch_timer.timeout.connect(self._flush_move)
         
-        # UI overlay
+        # UI overlay (dimmed pixmap cached per overlay size)
         self.overlay = None
         self.instruction_label = None
+        self._overlay_size = None
+        
+        # Position labels currently shown (hidden in one pass on exit)
+        self._active_pos_labels = []
+
+        # Scaled sizes and label stylesheets, rebuilt only when the scale factor changes
+        self._style_version = -1
+
+        # Last stylesheet applied per tile
+        self._last_styles = {}
+
+        # Selected/target app indices at the last highlight pass (only those tiles can change role)
+        self._prev_sel = None
+        self._prev_tgt = None
 
-        # Debounce for buttons
-        self.last_button_times = {}
+        # Debounce for buttons: last press time (monotonic ns) indexed by button_index
+        self.last_button_times = [-(1 << 62)] * 32
+        self.button_debounce_ns = 300_000_000  # 300 ms
+
+        # Short-lived cache for _is_dialog_active: (timestamp, result)
+        self._dlg_cache = (0.0, False)
+        self._dlg_cache_ttl = 0.05  # seconds
         
         # Flag to prevent reactivation after exiting
         self.recently_exited = False
@@ -49,16 +139,16 @@ class ReorderMode:
     
     def _is_dialog_active(self):
         """Check if any dialog or menu is currently active"""
-        from PyQt6.QtWidgets import QApplication
-        # Check if any modal dialog is open
-        active_modal = QApplication.activeModalWidget()
-        if active_modal:
-            return True
-        # Check if any popup is open
-        active_popup = QApplication.activePopupWidget()
-        if active_popup:
-            return True
-        return False
+        # Dialog state rarely changes between consecutive input events
+        now = time.monotonic()
+        checked_at, active = self._dlg_cache
+        if now - checked_at < self._dlg_cache_ttl:
+            return active
+        
+        # Check if any modal dialog is open (the launcher has no popup widgets)
+        active = QApplication.activeModalWidget() is not None
+        self._dlg_cache = (now, active)
+        return active
         
     def start_long_press(self):
         """Called when launch button is pressed"""
@@ -94,17 +184,39 @@ class ReorderMode:
             self.is_active = True
             self.selected_index = self.launcher.current_index
             self.target_index = self.launcher.current_index
+            self._last_styles.clear()
+            self._bind_moves()
+            self._refresh_style_cache()
             self._show_reorder_ui()
             self._update_tile_highlights()
-            print(f"🔄 Reorder mode activated - Selected: {self.launcher.apps[self.selected_index]['name']}")
+            if DEBUG:
+                print(f"🔄 Reorder mode activated - Selected: {self.launcher.apps[self.selected_index]['name']}")
     
+    def _refresh_style_cache(self):
+        """Precomputes scaled sizes and label stylesheets for the current scale factor"""
+        scaling = self.launcher.scaling
+        if self._style_version == scaling.scale_factor:
+            return
+        self._style_version = scaling.scale_factor
+
+        self._border_thick = scaling.scale(5)
+        self._border_thin = scaling.scale(2)
+        self._tile_font = scaling.scale_font(18)
+        self._instruction_top = scaling.scale(100)
+        self._pos_label_size = scaling.scale(50)
+        self._pos_label_offset = scaling.scale(10)
+
+        border_width = scaling.scale(3)
+        self._instruction_style = _INSTR_QSS % (
+            scaling.scale_font(18), scaling.scale(30), scaling.scale(20), border_width)
+        self._pos_label_style = _POS_LABEL_QSS % (
+            scaling.scale_font(32), scaling.scale(5), scaling.scale(25), border_width)
+
     def _show_reorder_ui(self):
         """Shows visual feedback for reorder mode"""
         if self.overlay is None:
             # Create semi-transparent overlay
-            self.overlay = QWidget(self.launcher)
-            self.overlay.setGeometry(0, 0, self.launcher.width(), self.launcher.height())
-            self.overlay.setStyleSheet("background-color: rgba(0, 0, 0, 0.5);")
+            self.overlay = QLabel(self.launcher)
             self.overlay.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
             
             # Create instruction label
@@ -115,25 +227,11 @@ class ReorderMode:
                 "Enter/A to confirm | Esc/B to cancel\n"
                 "R or RB to toggle mode"
             )
-            self.instruction_label.setStyleSheet(f"""
-                QLabel {{
-                    background-color: rgba(30, 30, 30, 0.95);
-                    color: white;
-                    font-size: {self.launcher.scaling.scale_font(18)}px;
-                    font-weight: bold;
-                    padding: {self.launcher.scaling.scale(30)}px;
-                    border-radius: {self.launcher.scaling.scale(20)}px;
-                    border: {self.launcher.scaling.scale(3)}px solid white;
-                }}
-            """)
+            self.instruction_label.setStyleSheet(self._instruction_style)
             self.instruction_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            # Position at top center
             self.instruction_label.adjustSize()
-            x = (self.launcher.width() - self.instruction_label.width()) // 2
-            y = self.launcher.scaling.scale(100)
-            self.instruction_label.move(x, y)
         
+        self._update_overlay_geometry()
         self.overlay.raise_()
         self.overlay.show()
         self.instruction_label.show()
@@ -141,6 +239,28 @@ class ReorderMode:
         # Add position numbers to tiles
         self._add_position_numbers()
     
+    def _update_overlay_geometry(self):
+        """Fits the overlay to the launcher, regenerating the dimmed pixmap only when the size changes"""
+        size = (self.launcher.width(), self.launcher.height())
+        if self._overlay_size == size:
+            return
+        self._overlay_size = size
+        
+        w, h = size
+        image = QImage(1, 1, QImage.Format.Format_ARGB32)
+        image.fill(QColor(0, 0, 0, 128))
+        self.overlay.setGeometry(0, 0, w, h)
+        self.overlay.setPixmap(QPixmap.fromImage(image).scaled(w, h))
+        
+        # Keep the instruction label at top center
+        x = (w - self.instruction_label.width()) // 2
+        self.instruction_label.move(x, self._instruction_top)
+    
+    def on_launcher_resized(self):
+        """Updates the existing overlay after a launcher resize instead of rebuilding it"""
+        if self.overlay is not None:
+            self._update_overlay_geometry()
+    
     def _hide_reorder_ui(self):
         """Hides reorder mode UI"""
         if self.overlay:
@@ -156,145 +276,164 @@ class ReorderMode:
         if not self.launcher.tiles:
             return
         
+        active = []
         for tile in self.launcher.tiles:
-            if not hasattr(tile, 'position_label'):
+            if getattr(tile, 'position_label', None) is None:
                 # Create position label
                 tile.position_label = QLabel(tile)
                 tile.position_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                tile.position_label.setStyleSheet(f"""
-                    QLabel {{
-                        background-color: rgba(0, 0, 0, 0.8);
-                        color: white;
-                        font-size: {self.launcher.scaling.scale_font(32)}px;
-                        font-weight: bold;
-                        border-radius: {self.launcher.scaling.scale(25)}px;
-                        border: {self.launcher.scaling.scale(3)}px solid white;
-                        padding: {self.launcher.scaling.scale(5)}px;
-                    }}
-                """)
+                tile.position_label.setStyleSheet(self._pos_label_style)
                 
                 # Position in top-left corner of tile
-                size = self.launcher.scaling.scale(50)
-                tile.position_label.setFixedSize(size, size)
-                tile.position_label.move(
-                    self.launcher.scaling.scale(10),
-                    self.launcher.scaling.scale(10)
-                )
+                tile.position_label.setFixedSize(self._pos_label_size, self._pos_label_size)
+                tile.position_label.move(self._pos_label_offset, self._pos_label_offset)
             
             # Update the number (1-based indexing for user)
-            tile.position_label.setText(str(tile.app_index + 1))
+            text = str(tile.app_index + 1)
+            if getattr(tile, '_position_label_text', None) != text:
+                tile.position_label.setText(text)
+                tile._position_label_text = text
             tile.position_label.show()
             tile.position_label.raise_()
+            active.append(tile.position_label)
+        self._active_pos_labels = active
     
     def _remove_position_numbers(self):
         """Removes position number labels from tiles"""
-        if not self.launcher.tiles:
-            return
-        
-        for tile in self.launcher.tiles:
-            if hasattr(tile, 'position_label'):
-                tile.position_label.hide()
+        for label in self._active_pos_labels:
+            label.hide()
+        self._active_pos_labels.clear()
     
     def _update_tile_highlights(self):
         """Updates visual highlights on tiles during reorder"""
         if not self.is_active or not self.launcher.tiles:
             return
-        
-        num_apps = len(self.launcher.apps)
-        
-        for i, tile in enumerate(self.launcher.tiles):
+
+        self._refresh_style_cache()
+
+        # After a reset every tile needs a role; otherwise only old/new selected and target can change
+        full_pass = not self._last_styles
+        changed = {self._prev_sel, self._prev_tgt, self.selected_index, self.target_index} - {None}
+
+        for tile in self.launcher.tiles:
             app_idx = tile.app_index
-            
-            # Selected tile - bright gold border
+            if not full_pass and app_idx not in changed:
+                continue
+
             if app_idx == self.selected_index:
-                tile.image_label.setStyleSheet(f"""
-                    QLabel {{
-                        background-color: #1a1a1a;
-                        border: {self.launcher.scaling.scale(5)}px solid #FFD700;
-                        border-radius: {tile.border_radius}px;
-                        color: #ffffff;
-                        font-size: {self.launcher.scaling.scale_font(18)}px;
-                        font-weight: 600;
-                    }}
-                """)
-            # Target position - blue border
+                role = 'selected'
             elif app_idx == self.target_index:
-                tile.image_label.setStyleSheet(f"""
-                    QLabel {{
-                        background-color: #1a1a1a;
-                        border: {self.launcher.scaling.scale(5)}px solid #00BFFF;
-                        border-radius: {tile.border_radius}px;
-                        color: #ffffff;
-                        font-size: {self.launcher.scaling.scale_font(18)}px;
-                        font-weight: 600;
-                    }}
-                """)
-            # Normal tiles
+                role = 'target'
             else:
-                tile.image_label.setStyleSheet(f"""
-                    QLabel {{
-                        background-color: #1a1a1a;
-                        border: {self.launcher.scaling.scale(2)}px solid #444;
-                        border-radius: {tile.border_radius}px;
-                        color: #cccccc;
-                        font-size: {self.launcher.scaling.scale_font(18)}px;
-                        font-weight: 600;
-                    }}
-                """)
-        
-        # Update position numbers
-        self._add_position_numbers()    
-    def move_left(self):
-        """Moves target position left"""
+                role = 'normal'
+
+            width = self._border_thin if role == 'normal' else self._border_thick
+            qss = _tile_role_style(role, tile.border_radius, width, self._tile_font)
+
+            # Restyle only tiles whose stylesheet actually changed
+            if self._last_styles.get(tile) is not qss:
+                tile.image_label.setStyleSheet(qss)
+                self._last_styles[tile] = qss
+
+        self._prev_sel = self.selected_index
+        self._prev_tgt = self.target_index
+
+    def _refresh_after_carousel_move(self):
+        """Refreshes highlights and position numbers once the carousel has rebound its tiles"""
         if not self.is_active:
-            return False
-        
-        num_apps = len(self.launcher.apps)
-        
-        if num_apps <= 5:
-            # Linear movement
-            if self.target_index > 0:
-                self.target_index -= 1
-                # Don't animate, just update highlights
-                self._update_tile_highlights()
-                return True
+            return
+        self._update_tile_highlights()
+        self._add_position_numbers()
+
+    def move_left(self):
+        """Moves target position left (replaced by a specialized version while active)"""
+        return False
+    
+    def move_right(self):
+        """Moves target position right (replaced by a specialized version while active)"""
+        return False
+    
+    def _bind_moves(self):
+        """Binds the linear or carousel move handlers for this session's app count"""
+        self._num_apps = len(self.launcher.apps)
+        if self._num_apps <= 5:
+            self.move_left, self.move_right = self._move_left_linear, self._move_right_linear
         else:
-            # Circular movement - update target BEFORE animation
-            new_target = (self.target_index - 1) % num_apps
-            self.target_index = new_target
-            self.launcher.current_index = self.target_index
-            self.launcher.animate_carousel("left")
-            # Highlights will update after animation
-            QTimer.singleShot(260, self._update_tile_highlights)
+            self.move_left, self.move_right = self._move_left_carousel, self._move_right_carousel
+    
+    def _unbind_moves(self):
+        """Restores the inactive move handlers"""
+        self.__dict__.pop('move_left', None)
+        self.__dict__.pop('move_right', None)
+    
+    def _move_left_linear(self):
+        """Moves target position left - linear movement"""
+        if self.target_index > 0:
+            self.target_index -= 1
+            # Don't animate, just update highlights
+            self._update_tile_highlights()
             return True
-        
         return False
     
-    def move_right(self):
-        """Moves target position right"""
-        if not self.is_active:
-            return False
-        
+    def _move_right_linear(self):
+        """Moves target position right - linear movement"""
+        if self.target_index < self._num_apps - 1:
+            self.target_index += 1
+            # Don't animate, just update highlights
+            self._update_tile_highlights()
+            return True
+        return False
+    
+    def _move_left_carousel(self):
+        """Moves target position left - circular movement, applied once presses stop arriving"""
+        self._pending_delta -= 1
+        self._batch_timer.start(50)
+        return True
+    
+    def _move_right_carousel(self):
+        """Moves target position right - circular movement, applied once presses stop arriving"""
+        self._pending_delta += 1
+        self._batch_timer.start(50)
+        return True
+    
+    def _take_pending_delta(self):
+        """Applies the batched moves to the target index and returns the net step count"""
         num_apps = len(self.launcher.apps)
+        delta = self._pending_delta % num_apps if num_apps else 0
+        self._pending_delta = 0
+        if delta > num_apps // 2:
+            delta -= num_apps  # Shortest way round the carousel
         
-        if num_apps <= 5:
-            # Linear movement
-            if self.target_index < num_apps - 1:
-                self.target_index += 1
-                # Don't animate, just update highlights
-                self._update_tile_highlights()
-                return True
-        else:
-            # Circular movement - update target BEFORE animation
-            new_target = (self.target_index + 1) % num_apps
-            self.target_index = new_target
+        if delta:
+            self.target_index = (self.target_index + delta) % num_apps
             self.launcher.current_index = self.target_index
-            self.launcher.animate_carousel("right")
-            # Highlights will update after animation
-            QTimer.singleShot(260, self._update_tile_highlights)
-            return True
+        return delta
+    
+    def _flush_move(self):
+        """Moves the carousel by the accumulated delta with a single animation"""
+        if not self.is_active:
+            self._pending_delta = 0
+            return
+        if self.launcher.is_animating:
+            # Previous slide still running, try again once it has settled
+            self._batch_timer.start(50)
+            return
         
-        return False
+        delta = self._take_pending_delta()
+        if not delta:
+            return
+        
+        # reposition_tiles() restyles every tile via set_focused()
+        self._last_styles.clear()
+        if delta in (1, -1):
+            self.launcher.animate_carousel("right" if delta > 0 else "left")
+            # Highlights will update after animation
+            self._post_anim_timer.start(260)
+        else:
+            # animate_carousel() slides one slot at a time, jump straight there instead
+            self._remove_position_numbers()  # The rebuild may reuse or delete their tiles
+            self.launcher.build_infinite_carousel()
+            self._refresh_after_carousel_move()
     
     def confirm_reorder(self):
         """Confirms and applies the reorder"""
@@ -304,6 +443,10 @@ class ReorderMode:
         # Set flag IMMEDIATELY to block any other handlers
         self.recently_exited = True
         
+        # Include moves still waiting in the batch window
+        self._batch_timer.stop()
+        self._take_pending_delta()
+        
         if self.selected_index != self.target_index:
             # Perform the reorder
             app_to_move = self.launcher.apps.pop(self.selected_index)
@@ -312,14 +455,14 @@ class ReorderMode:
             # Update current index to follow the moved app
             self.launcher.current_index = self.target_index
             
-            # Save and rebuild
-            self.launcher.save_config()
+            # Save on the next event-loop turn so the rebuilt carousel paints first
+            QTimer.singleShot(0, self.launcher.save_config)
             
-            print(f"✅ Moved '{app_to_move['name']}' from position {self.selected_index} to {self.target_index}")
+            if DEBUG:
+                print(f"✅ Moved '{app_to_move['name']}' from position {self.selected_index} to {self.target_index}")
         
-        self._exit_reorder()
         # Rebuild AFTER exiting to avoid triggering reorder mode again
-        self.launcher.build_infinite_carousel()
+        self._exit_reorder()
         
         # Longer cooldown after confirm to prevent accidental launch
         self.exit_cooldown_timer.start(1000)  # 1 second cooldown
@@ -331,22 +474,32 @@ class ReorderMode:
             return False
         
         # Return to original position
-        original_index = self.selected_index
+        self.launcher.current_index = self.selected_index
         
-        print("❌ Reorder cancelled")
+        if DEBUG:
+            print("❌ Reorder cancelled")
         self._exit_reorder()
-        
-        # Rebuild AFTER exiting
-        self.launcher.current_index = original_index
-        self.launcher.build_infinite_carousel()
         return True
     
     def _exit_reorder(self):
-        """Exits reorder mode and cleans up"""
+        """Exits reorder mode, cleans up and rebuilds the carousel in a single repaint"""
         self.is_active = False
         self.selected_index = None
         self.target_index = None
-        self._hide_reorder_ui()
+        self._last_styles.clear()
+        self._unbind_moves()
+        self._post_anim_timer.stop()
+        self._batch_timer.stop()
+        self._pending_delta = 0
+        
+        # Batch hides and the tile rebuild so Qt does one layout/paint pass
+        self.launcher.setUpdatesEnabled(False)
+        try:
+            self._hide_reorder_ui()
+            self.launcher.build_infinite_carousel()
+        finally:
+            self.launcher.setUpdatesEnabled(True)
+        self.launcher.update()
         
         # Set cooldown to prevent immediate reactivation
         self.recently_exited = True
@@ -357,8 +510,11 @@ class ReorderMode:
     
     def handle_joypad_button(self, button_index):
         """Handles joypad button for reorder mode - RB button (5) toggles"""
-        current_time = time.time()
-        if button_index in self.last_button_times and current_time - self.last_button_times[button_index] < 0.3:
+        if button_index >= len(self.last_button_times):
+            self.last_button_times.extend([-(1 << 62)] * (button_index + 1 - len(self.last_button_times)))
+        
+        current_time = time.monotonic_ns()
+        if current_time - self.last_button_times[button_index] < self.button_debounce_ns:
             return False
         self.last_button_times[button_index] = current_time
 
@@ -380,71 +536,79 @@ class ReorderMode:
         return False
 
 
-def integrate_reorder_mode(launcher):
-    """
-    Integrates reorder mode into the launcher.
-    Call this from TVLauncher.__init__() after self.init_ui()
-    
-    Usage:
-        from app_reorder import integrate_reorder_mode
-        # In TVLauncher.__init__:
-        integrate_reorder_mode(self)
-    """
-    launcher.reorder_mode = ReorderMode(launcher)
+class _ReorderEventBridge:
+    """Routes launcher input through reorder mode before the original handlers"""
     
-    # Store original keyPressEvent
-    original_key_press = launcher.keyPressEvent
+    def __init__(self, launcher, original_key_press, original_key_release,
+                 original_launch, original_handle_button, original_handle_navigation,
+                 original_resize):
+        self.launcher = launcher
+        self.reorder = launcher.reorder_mode
+        self.original_key_press = original_key_press
+        self.original_key_release = original_key_release
+        self.original_launch = original_launch
+        self.original_handle_button = original_handle_button
+        self.original_handle_navigation = original_handle_navigation
+        self.original_resize = original_resize
+        
+        # Button dispatch tables, built once: A/B while active, RB toggles
+        self.active_buttons = {
+            0: (self.reorder.confirm_reorder, "✅ A button pressed in reorder mode - confirming"),
+            1: (self.reorder.cancel_reorder, "❌ B button pressed in reorder mode - canceling"),
+        }
+        self.toggle_buttons = frozenset((5, 10))
     
-    def enhanced_key_press(event):
+    def key_press(self, event):
         """Enhanced keyPressEvent with reorder support"""
+        reorder = self.reorder
+        key = event.key()
+        
         if event.isAutoRepeat():
-            original_key_press(event)
+            # Swallow repeats of reorder keys during reorder, forward everything else
+            if key in _REORDER_KEYS and reorder.is_active:
+                return
+            self.original_key_press(event)
             return
         
-        key = event.key()
-        
         # R key toggles reorder mode
         if key == Qt.Key.Key_R:
             # Don't activate if dialog is open or in menu
-            if launcher.reorder_mode._is_dialog_active() or launcher.is_in_menu:
+            if reorder._is_dialog_active() or self.launcher.is_in_menu:
                 #print("🚫 Reorder blocked - dialog or menu active")
-                original_key_press(event)
+                self.original_key_press(event)
                 return
                 
-            if not launcher.reorder_mode.is_active:
-                if launcher.apps and not launcher.reorder_mode.recently_exited:
-                    launcher.reorder_mode._activate_reorder()
+            if not reorder.is_active:
+                if self.launcher.apps and not reorder.recently_exited:
+                    reorder._activate_reorder()
             else:
-                launcher.reorder_mode.cancel_reorder()
+                reorder.cancel_reorder()
             return
         
         # In reorder mode, intercept navigation
-        if launcher.reorder_mode.is_active:
+        if reorder.is_active:
             if key == Qt.Key.Key_Left:
-                if launcher.reorder_mode.move_left():
+                if reorder.move_left():
                     return
             elif key == Qt.Key.Key_Right:
-                if launcher.reorder_mode.move_right():
+                if reorder.move_right():
                     return
             elif key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
-                if launcher.reorder_mode.confirm_reorder():
+                if reorder.confirm_reorder():
                     return
             elif key == Qt.Key.Key_Escape:
-                if launcher.reorder_mode.cancel_reorder():
+                if reorder.cancel_reorder():
                     return
         else:
             # Long press detection for Enter key (only if not in menu/dialog)
             if key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
-                if not launcher.is_in_menu and not launcher.reorder_mode._is_dialog_active():
-                    launcher.reorder_mode.start_long_press()
+                if not self.launcher.is_in_menu and not reorder._is_dialog_active():
+                    reorder.start_long_press()
         
         # Pass to original handler
-        original_key_press(event)
+        self.original_key_press(event)
     
-    # Store original keyReleaseEvent if it exists
-    original_key_release = getattr(launcher, 'keyReleaseEvent', None)
-    
-    def enhanced_key_release(event):
+    def key_release(self, event):
         """Enhanced keyReleaseEvent for long press detection"""
         if event.isAutoRepeat():
             return
@@ -452,87 +616,105 @@ def integrate_reorder_mode(launcher):
         key = event.key()
         
         if key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
-            if not launcher.reorder_mode.is_active:
-                launcher.reorder_mode.cancel_long_press()
+            if not self.reorder.is_active:
+                self.reorder.cancel_long_press()
         
-        if original_key_release:
-            original_key_release(event)
-    
-    # Store original launch_current_app to cancel timers
-    original_launch = launcher.launch_current_app
+        if self.original_key_release:
+            self.original_key_release(event)
     
-    def enhanced_launch():
+    def launch(self):
         """Enhanced launch that cancels all reorder timers"""
         # Force cancel any pending reorder activation
-        launcher.reorder_mode.force_cancel_all_timers()
-        launcher.reorder_mode.recently_exited = False
+        self.reorder.force_cancel_all_timers()
+        self.reorder.recently_exited = False
         # Call original launch
-        original_launch()
-    
-    launcher.launch_current_app = enhanced_launch
+        self.original_launch()
     
-    # Store original handle_button
-    original_handle_button = launcher.handle_button
-    
-    def enhanced_handle_button(button_index):
+    def handle_button(self, button_index):
         """Enhanced button handler with reorder support"""
+        reorder = self.reorder
         # CRITICAL: Block all button handling during cooldown
-        if launcher.reorder_mode.recently_exited:
+        if reorder.recently_exited:
             #print(f"🚫 Button {button_index} blocked during cooldown")
             return
         
         # In reorder mode, handle A and B buttons specially
-        if launcher.reorder_mode.is_active:
-            if button_index == 0:  # A button - confirm reorder
-                print("✅ A button pressed in reorder mode - confirming")
-                launcher.reorder_mode.confirm_reorder()
-                return  # Don't pass to original handler
-            elif button_index == 1:  # B button - cancel reorder
-                print("❌ B button pressed in reorder mode - canceling")
-                launcher.reorder_mode.cancel_reorder()
+        if reorder.is_active:
+            entry = self.active_buttons.get(button_index)
+            if entry is not None:
+                handler, message = entry
+                if DEBUG:
+                    print(message)
+                handler()
                 return  # Don't pass to original handler
         
         # RB button (button 5) toggles reorder mode
-        if launcher.reorder_mode.handle_joypad_button(button_index):
+        if button_index in self.toggle_buttons and reorder.handle_joypad_button(button_index):
             return
         
         # Pass to original handler if not handled by reorder mode
-        original_handle_button(button_index)
-    
-    # Store original handle_navigation and enhance it for controller support in reorder mode
-    if hasattr(launcher, 'handle_navigation'):
-        original_handle_navigation = launcher.handle_navigation
-        
-        def enhanced_handle_navigation(direction):
-            """Enhanced navigation handler with reorder support"""
-            if launcher.reorder_mode.is_active:
-                if direction == "left":
-                    return launcher.reorder_mode.move_left()
-                elif direction == "right":
-                    return launcher.reorder_mode.move_right()
-                return False
-            else:
-                original_handle_navigation(direction)
-        
-        launcher.handle_navigation = enhanced_handle_navigation
+        self.original_handle_button(button_index)
+    
+    def handle_navigation(self, direction):
+        """Enhanced navigation handler with reorder support"""
+        if self.reorder.is_active:
+            if direction == "left":
+                return self.reorder.move_left()
+            elif direction == "right":
+                return self.reorder.move_right()
+            return False
+        else:
+            self.original_handle_navigation(direction)
+    
+    def resize(self, event):
+        """Enhanced resizeEvent that refits the reorder overlay"""
+        self.original_resize(event)
+        self.reorder.on_launcher_resized()
+
+
+def integrate_reorder_mode(launcher):
+    """
+    Integrates reorder mode into the launcher.
+    Call this from TVLauncher.__init__() after self.init_ui()
+    The launcher should expose its help label as self.instructions_label
+    
+    Usage:
+        from app_reorder import integrate_reorder_mode
+        # In TVLauncher.__init__:
+        integrate_reorder_mode(self)
+    """
+    launcher.reorder_mode = ReorderMode(launcher)
+    
+    # Keep the original handlers; the bridge calls them for anything reorder mode doesn't consume
+    bridge = _ReorderEventBridge(
+        launcher,
+        launcher.keyPressEvent,
+        getattr(launcher, 'keyReleaseEvent', None),
+        launcher.launch_current_app,
+        launcher.handle_button,
+        getattr(launcher, 'handle_navigation', None),
+        launcher.resizeEvent,
+    )
     
     # Replace methods
-    launcher.keyPressEvent = enhanced_key_press
-    launcher.keyReleaseEvent = enhanced_key_release
-    launcher.handle_button = enhanced_handle_button
+    launcher.launch_current_app = bridge.launch
+    if bridge.original_handle_navigation is not None:
+        # Controller support in reorder mode
+        launcher.handle_navigation = bridge.handle_navigation
+    launcher.resizeEvent = bridge.resize
+    launcher.keyPressEvent = bridge.key_press
+    launcher.keyReleaseEvent = bridge.key_release
+    launcher.handle_button = bridge.handle_button
     
     # Update instructions label
-    if hasattr(launcher, 'findChild'):
-        instructions = launcher.findChildren(QLabel)
-        for label in instructions:
-            if "Navigate:" in label.text():
-                label.setText(
-                    "Navigate: ← → ↑ ↓ | Launch: Enter/A | Edit: E | Delete: Del/Y | "
-                    "Reorder: R/RB | Search: F/LB | Exit: Esc/B"
-                )
-                label.setStyleSheet(f"""
-                    color: rgba(255, 255, 255, 0.3);
-                    font-size: {launcher.scaling.scale_font(11)}px;
-                    background: transparent;
-                """)
-                break
\ No newline at end of file
+    label = getattr(launcher, 'instructions_label', None)
+    if label is not None:
+        label.setText(
+            "Navigate: ← → ↑ ↓ | Launch: Enter/A | Edit: E | Delete: Del/Y | "
+            "Reorder: R/RB | Search: F/LB | Exit: Esc/B"
+        )
+        label.setStyleSheet(f"""
+            color: rgba(255, 255, 255, 0.3);
+            font-size: {launcher.scaling.scale_font(11)}px;
+            background: transparent;
+        """)
\ No newline at end of file
@@ -1,9 +1,109 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QLineEdit, QListWidget, QListWidgetItem, QGraphicsDropShadowEffect
+    QLineEdit, QListView, QGraphicsDropShadowEffect
+)
+from PyQt6.QtCore import (
+    Qt, QTimer, pyqtSignal, QPropertyAnimation, QEasingCurve, QRect,
+    QAbstractListModel, QModelIndex
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QPropertyAnimation, QEasingCurve, QRect
 from PyQt6.QtGui import QFont, QKeyEvent, QColor
+from bisect import bisect_left
+from itertools import chain, compress, repeat
+
+
+# Legenda comandi mostrata in fondo al widget: (tasto, azione)
+_INSTRUCTIONS = (
+    ("Type", "Search"),
+    ("↑↓", "Navigate"),
+    ("Enter/A", "Launch"),
+    ("Esc/B", "Close"),
+    ("Tab/X", "Mode"),
+)
+
+
+def _build_instructions_footer(px, fpx):
+    """
+    Crea la riga delle istruzioni come un unico layout piatto di etichette:
+    niente QWidget + QHBoxLayout intermedi per ogni coppia tasto/azione.
+    """
+    key_qss = f"""
+            background-color: rgba(255, 255, 255, 0.1);
+            color: rgba(255, 255, 255, 0.9);
+            padding: {px[4]}px {px[10]}px;
+            border-radius: {px[6]}px;
+            font-size: {fpx[12]}px;
+            font-weight: 600;
+        """
+    action_qss = f"""
+            color: rgba(255, 255, 255, 0.5);
+            font-size: {fpx[12]}px;
+        """
+    
+    instructions_layout = QHBoxLayout()
+    instructions_layout.setSpacing(0)
+    for i, (key, action) in enumerate(_INSTRUCTIONS):
+        if i:
+            instructions_layout.addSpacing(px[20])
+        
+        key_label = QLabel(key)
+        key_label.setStyleSheet(key_qss)
+        
+        action_label = QLabel(action)
+        action_label.setStyleSheet(action_qss)
+        
+        instructions_layout.addWidget(key_label)
+        instructions_layout.addSpacing(px[8])
+        instructions_layout.addWidget(action_label)
+    
+    instructions_layout.addStretch()
+    return instructions_layout
+
+
+class _ResultsModel(QAbstractListModel):
+    """
+    Modello dei risultati: le righe vengono formattate solo quando la vista le disegna.
+    Opzionalmente termina con una riga non selezionabile ("No apps found" / "more matches").
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names = []
+        self._original_indices = []
+        self._positions = []  # Posizioni nelle liste parallele, nell'ordine mostrato
+        self._footer = None
+    
+    def set_rows(self, names, original_indices, positions, footer=None):
+        """Sostituisce tutte le righe con un solo reset del modello"""
+        self.beginResetModel()
+        self._names = names
+        self._original_indices = original_indices
+        self._positions = positions
+        self._footer = footer
+        self.endResetModel()
+    
+    def app_count(self):
+        """Numero di righe che corrispondono ad app (esclusa la riga finale)"""
+        return len(self._positions)
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._positions) + (1 if self._footer else 0)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        row = index.row()
+        if row >= len(self._positions):
+            return self._footer if role == Qt.ItemDataRole.DisplayRole else None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"🎮  {self._names[self._positions[row]]}"
+        if role == Qt.ItemDataRole.UserRole:
+            return self._original_indices[self._positions[row]]
+        return None
+    
+    def flags(self, index):
+        if index.row() >= len(self._positions):
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
 
 
 class QuickSearchWidget(QWidget):
@@ -14,11 +114,18 @@ class QuickSearchWidget(QWidget):
     app_selected = pyqtSignal(int)  # Emette l'indice dell'app selezionata
     search_closed = pyqtSignal()    # Emette quando la ricerca viene chiusa
     
+    MAX_DISPLAYED = 50  # Righe massime nella lista, oltre si mostra "... more matches"
+    
     def __init__(self, scaling, parent=None):
         super().__init__(parent)
         self.scaling = scaling
         self.apps = []  # Lista delle app da cercare
-        self.filtered_indices = []  # Indici delle app filtrate
+        # Liste parallele in ordine alfabetico: nome, nome minuscolo, indice in self.apps
+        self._names = []
+        self._names_lower = []
+        self._original_indices = []
+        self._last_query = ''  # Ultima ricerca filtrata e sue posizioni nelle liste parallele
+        self._last_filtered = []
         self.current_selection = 0
         self.is_typing_mode = True  # True = digita, False = naviga risultati
         
@@ -30,12 +137,18 @@ class QuickSearchWidget(QWidget):
     
     def init_ui(self):
         """Inizializza l'interfaccia utente"""
+        # Valori scalati calcolati una volta sola (la scala è costante per tutta la vita del widget)
+        scale = self.scaling.scale
+        scale_font = self.scaling.scale_font
+        px = {v: scale(v) for v in (1, 2, 4, 5, 6, 8, 10, 12, 15, 20, 30, 40, 50, 600, 800)}
+        fpx = {v: scale_font(v) for v in (11, 12, 14, 16, 20, 24, 32)}
+        
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.Tool)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         
         # Dimensioni responsive
-        width = self.scaling.scale(800)
-        height = self.scaling.scale(600)
+        width = px[800]
+        height = px[600]
         self.setFixedSize(width, height)
         
         # Container principale con sfondo scuro
@@ -48,18 +161,18 @@ class QuickSearchWidget(QWidget):
         self.container.setStyleSheet(f"""
             QWidget {{
                 background-color: rgba(20, 20, 20, 0.98);
-                border-radius: {self.scaling.scale(20)}px;
-                border: {self.scaling.scale(2)}px solid rgba(255, 255, 255, 0.1);
+                border-radius: {px[20]}px;
+                border: {px[2]}px solid rgba(255, 255, 255, 0.1);
             }}
         """)
         
         container_layout = QVBoxLayout(self.container)
-        container_layout.setSpacing(self.scaling.scale(20))
+        container_layout.setSpacing(px[20])
         container_layout.setContentsMargins(
-            self.scaling.scale(30),
-            self.scaling.scale(30),
-            self.scaling.scale(30),
-            self.scaling.scale(30)
+            px[30],
+            px[30],
+            px[30],
+            px[30]
         )
         
         # === HEADER ===
@@ -68,7 +181,7 @@ class QuickSearchWidget(QWidget):
         # Icona ricerca
         search_icon = QLabel("🔍")
         search_icon.setStyleSheet(f"""
-            font-size: {self.scaling.scale_font(32)}px;
+            font-size: {fpx[32]}px;
         """)
         header_layout.addWidget(search_icon)
         
@@ -79,17 +192,22 @@ class QuickSearchWidget(QWidget):
             QLineEdit {{
                 background-color: rgba(40, 40, 40, 0.8);
                 color: white;
-                border: {self.scaling.scale(2)}px solid rgba(255, 255, 255, 0.2);
-                border-radius: {self.scaling.scale(12)}px;
-                padding: {self.scaling.scale(15)}px {self.scaling.scale(20)}px;
-                font-size: {self.scaling.scale_font(20)}px;
+                border: {px[2]}px solid rgba(255, 255, 255, 0.2);
+                border-radius: {px[12]}px;
+                padding: {px[15]}px {px[20]}px;
+                font-size: {fpx[20]}px;
                 font-weight: 500;
             }}
             QLineEdit:focus {{
-                border: {self.scaling.scale(2)}px solid rgba(255, 255, 255, 0.5);
+                border: {px[2]}px solid rgba(255, 255, 255, 0.5);
             }}
         """)
         self.search_input.textChanged.connect(self.on_search_text_changed)
+        
+        # Debounce: filtra solo dopo l'ultimo tasto di una raffica
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.timeout.connect(self.update_results)
         header_layout.addWidget(self.search_input, stretch=1)
         
         # Pulsante chiudi (CLICCABILE)
@@ -98,12 +216,12 @@ class QuickSearchWidget(QWidget):
             QPushButton {{
                 background-color: rgba(255, 50, 50, 0.2);
                 color: rgba(255, 255, 255, 0.7);
-                font-size: {self.scaling.scale_font(24)}px;
+                font-size: {fpx[24]}px;
                 border: none;
-                border-radius: {self.scaling.scale(20)}px;
-                padding: {self.scaling.scale(8)}px;
-                min-width: {self.scaling.scale(40)}px;
-                min-height: {self.scaling.scale(40)}px;
+                border-radius: {px[20]}px;
+                padding: {px[8]}px;
+                min-width: {px[40]}px;
+                min-height: {px[40]}px;
             }}
             QPushButton:hover {{
                 background-color: rgba(255, 50, 50, 0.4);
@@ -119,14 +237,23 @@ class QuickSearchWidget(QWidget):
         
         container_layout.addLayout(header_layout)
         
-        # Mode indicator
-        self.mode_label = QLabel("🔤 TYPING MODE")
-        self.mode_label.setStyleSheet(f"""
+        # Mode indicator (stili delle due modalità calcolati una volta sola)
+        mode_font = fpx[11]
+        mode_padding = f"{px[5]}px {px[10]}px"
+        self._typing_qss = f"""
             color: rgba(100, 200, 255, 0.8);
-            font-size: {self.scaling.scale_font(11)}px;
+            font-size: {mode_font}px;
             font-weight: 600;
-            padding: {self.scaling.scale(5)}px {self.scaling.scale(10)}px;
-        """)
+            padding: {mode_padding};
+        """
+        self._nav_qss = f"""
+            color: rgba(100, 255, 150, 0.8);
+            font-size: {mode_font}px;
+            font-weight: 600;
+            padding: {mode_padding};
+        """
+        self.mode_label = QLabel("🔤 TYPING MODE")
+        self.mode_label.setStyleSheet(self._typing_qss)
         self.mode_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         container_layout.addWidget(self.mode_label)
         
@@ -134,7 +261,7 @@ class QuickSearchWidget(QWidget):
         results_label = QLabel("Results")
         results_label.setStyleSheet(f"""
             color: rgba(255, 255, 255, 0.6);
-            font-size: {self.scaling.scale_font(14)}px;
+            font-size: {fpx[14]}px;
             font-weight: 600;
             text-transform: uppercase;
             letter-spacing: 1px;
@@ -142,89 +269,99 @@ class QuickSearchWidget(QWidget):
         container_layout.addWidget(results_label)
         
         # Lista risultati
-        self.results_list = QListWidget()
+        self._results_model = _ResultsModel(self)
+        self.results_list = QListView()
+        self.results_list.setModel(self._results_model)
         self.results_list.setStyleSheet(f"""
-            QListWidget {{
+            QListView {{
                 background-color: rgba(30, 30, 30, 0.5);
-                border: {self.scaling.scale(1)}px solid rgba(255, 255, 255, 0.1);
-                border-radius: {self.scaling.scale(12)}px;
-                padding: {self.scaling.scale(10)}px;
-                font-size: {self.scaling.scale_font(16)}px;
+                border: {px[1]}px solid rgba(255, 255, 255, 0.1);
+                border-radius: {px[12]}px;
+                padding: {px[10]}px;
+                font-size: {fpx[16]}px;
                 outline: none;
             }}
-            QListWidget::item {{
+            QListView::item {{
                 color: rgba(255, 255, 255, 0.8);
-                padding: {self.scaling.scale(15)}px {self.scaling.scale(20)}px;
-                border-radius: {self.scaling.scale(8)}px;
-                margin: {self.scaling.scale(2)}px 0px;
+                padding: {px[15]}px {px[20]}px;
+                border-radius: {px[8]}px;
+                margin: {px[2]}px 0px;
             }}
-            QListWidget::item:selected {{
+            QListView::item:selected {{
                 background-color: rgba(255, 255, 255, 0.15);
                 color: white;
                 font-weight: 600;
-                border: {self.scaling.scale(2)}px solid rgba(255, 255, 255, 0.3);
+                border: {px[2]}px solid rgba(255, 255, 255, 0.3);
             }}
-            QListWidget::item:hover {{
+            QListView::item:hover {{
                 background-color: rgba(255, 255, 255, 0.08);
             }}
         """)
-        self.results_list.itemDoubleClicked.connect(self.on_item_activated)
+        self.results_list.doubleClicked.connect(self.on_item_activated)
         container_layout.addWidget(self.results_list, stretch=1)
         
         # === FOOTER - Istruzioni ===
-        instructions_layout = QHBoxLayout()
-        instructions_layout.setSpacing(self.scaling.scale(20))
-        
-        instructions = [
-            ("Type", "Search"),
-            ("↑↓", "Navigate"),
-            ("Enter/A", "Launch"),
-            ("Esc/B", "Close"),
-            ("Tab/X", "Mode")
-        ]
-        
-        for key, action in instructions:
-            inst_widget = QWidget()
-            inst_layout = QHBoxLayout(inst_widget)
-            inst_layout.setContentsMargins(0, 0, 0, 0)
-            inst_layout.setSpacing(self.scaling.scale(8))
-            
-            key_label = QLabel(key)
-            key_label.setStyleSheet(f"""
-                background-color: rgba(255, 255, 255, 0.1);
-                color: rgba(255, 255, 255, 0.9);
-                padding: {self.scaling.scale(4)}px {self.scaling.scale(10)}px;
-                border-radius: {self.scaling.scale(6)}px;
-                font-size: {self.scaling.scale_font(12)}px;
-                font-weight: 600;
-            """)
-            
-            action_label = QLabel(action)
-            action_label.setStyleSheet(f"""
-                color: rgba(255, 255, 255, 0.5);
-                font-size: {self.scaling.scale_font(12)}px;
-            """)
-            
-            inst_layout.addWidget(key_label)
-            inst_layout.addWidget(action_label)
-            instructions_layout.addWidget(inst_widget)
-        
-        instructions_layout.addStretch()
-        container_layout.addLayout(instructions_layout)
+        container_layout.addLayout(_build_instructions_footer(px, fpx))
         
         main_layout.addWidget(self.container)
         self.setLayout(main_layout)
         
         # Shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(self.scaling.scale(50))
-        shadow.setColor(QColor(0, 0, 0, 200))
-        shadow.setOffset(0, self.scaling.scale(10))
-        self.container.setGraphicsEffect(shadow)
+        # NOTA: il blur viene ricalcolato a ogni repaint, è il costo principale delle
+        # animazioni sui TV box: resta disattivato mentre l'opacità cambia
+        self._shadow = QGraphicsDropShadowEffect()
+        self._shadow.setBlurRadius(px[50])
+        self._shadow.setColor(QColor(0, 0, 0, 200))
+        self._shadow.setOffset(0, px[10])
+        self.container.setGraphicsEffect(self._shadow)
+        
+        # Animazioni di entrata/uscita create una volta sola e riusate
+        self._fade_in = QPropertyAnimation(self, b"windowOpacity")
+        self._fade_in.setDuration(200)
+        self._fade_in.setStartValue(0.0)
+        self._fade_in.setEndValue(1.0)
+        self._fade_in.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self._fade_in.finished.connect(lambda: self._shadow.setEnabled(True))
+        
+        self._fade_out = QPropertyAnimation(self, b"windowOpacity")
+        self._fade_out.setDuration(150)
+        self._fade_out.setStartValue(1.0)
+        self._fade_out.setEndValue(0.0)
+        self._fade_out.setEasingCurve(QEasingCurve.Type.InCubic)
+        self._fade_out.finished.connect(self.hide)
+        self._fade_out.finished.connect(self.search_closed.emit)
+        
+        # Tabelle tasto -> azione (joypad dal parent, tastiera fisica)
+        self._joypad_dispatch = {
+            Qt.Key.Key_Escape: self.close_search,
+            Qt.Key.Key_Up: self.navigate_up,
+            Qt.Key.Key_Down: self.navigate_down,
+            Qt.Key.Key_Return: self.launch_selected,
+            Qt.Key.Key_Enter: self.launch_selected,
+            Qt.Key.Key_E: self.switch_mode,  # X button per cambio modalità
+        }
+        self._key_dispatch = {
+            Qt.Key.Key_Escape: self.close_search,  # Esc chiude sempre
+            Qt.Key.Key_Tab: self.switch_mode,  # Tab cambia modalità
+            Qt.Key.Key_Return: self.launch_selected,  # Enter lancia l'app selezionata
+            Qt.Key.Key_Enter: self.launch_selected,
+            Qt.Key.Key_Down: self.navigate_down,  # Navigazione risultati (sempre attiva)
+            Qt.Key.Key_Up: self.navigate_up,
+        }
     
     def set_apps(self, apps):
         """Imposta la lista di app da cercare"""
         self.apps = apps
+        # Minuscole e ordinamento una volta sola, non a ogni tasto
+        names = [app['name'] for app in apps]
+        lower = [name.lower() for name in names]
+        order = sorted(range(len(names)), key=lower.__getitem__)
+        self._names = [names[i] for i in order]
+        self._names_lower = [lower[i] for i in order]
+        self._original_indices = order
+        self._last_query = ''
+        self._last_filtered = range(len(order))
+        self._search_timer.stop()
         self.update_results()
     
     def show_search(self):
@@ -239,39 +376,35 @@ class QuickSearchWidget(QWidget):
         self.show()
         self.raise_()
         
-        # Reset stato
+        # Reset stato (senza textChanged: i risultati si aggiornano una volta sola qui sotto)
+        self.search_input.blockSignals(True)
         self.search_input.clear()
+        self.search_input.blockSignals(False)
+        self._search_timer.stop()
         self.search_input.setFocus()
         self.is_typing_mode = True
         self.current_selection = 0
         self.update_mode_indicator()
         self.update_results()
         
-        # Animazione entrata
+        # Animazione entrata (ferma un'uscita in corso, altrimenti nasconderebbe il widget)
+        self._fade_out.stop()
         self.setWindowOpacity(0)
-        fade_in = QPropertyAnimation(self, b"windowOpacity")
-        fade_in.setDuration(200)
-        fade_in.setStartValue(0.0)
-        fade_in.setEndValue(1.0)
-        fade_in.setEasingCurve(QEasingCurve.Type.OutCubic)
-        fade_in.start()
-        self.fade_animation = fade_in
+        self._fade_in.stop()
+        self._shadow.setEnabled(False)
+        self._fade_in.start()
     
     def close_search(self):
         """Chiude il widget di ricerca con animazione"""
-        fade_out = QPropertyAnimation(self, b"windowOpacity")
-        fade_out.setDuration(150)
-        fade_out.setStartValue(1.0)
-        fade_out.setEndValue(0.0)
-        fade_out.setEasingCurve(QEasingCurve.Type.InCubic)
-        fade_out.finished.connect(self.hide)
-        fade_out.finished.connect(self.search_closed.emit)
-        fade_out.start()
-        self.fade_animation = fade_out
+        self._search_timer.stop()
+        self._fade_in.stop()
+        self._fade_out.stop()
+        self._shadow.setEnabled(False)
+        self._fade_out.start()
     
     def on_search_text_changed(self, text):
         """Gestisce il cambio del testo di ricerca"""
-        self.update_results()
+        self._search_timer.start(80)
         # Auto-switch to typing mode quando si digita
         if text and not self.is_typing_mode:
             self.is_typing_mode = True
@@ -280,63 +413,79 @@ class QuickSearchWidget(QWidget):
     def update_results(self):
         """Aggiorna la lista dei risultati in base alla ricerca"""
         search_text = self.search_input.text().lower().strip()
-        
-        self.results_list.clear()
-        self.filtered_indices = []
-
-        temp_results = []  # (app_name, index)
 
+        # 📌 Le liste sono già in ordine alfabetico: una posizione più bassa = nome precedente
+        names_lower = self._names_lower
         if not search_text:
             # Mostra tutte le app
-            for i, app in enumerate(self.apps):
-                temp_results.append((app["name"], i))
+            positions = range(len(names_lower))
         else:
-            # Filtra
-            for i, app in enumerate(self.apps):
-                app_name = app['name']
-                if search_text in app_name.lower():
-                    temp_results.append((app_name, i))
+            # Se la ricerca precedente è contenuta nella nuova, i risultati sono un sottoinsieme
+            if self._last_query and self._last_query in search_text:
+                source = sorted(self._last_filtered)  # Di nuovo in ordine alfabetico
+            else:
+                source = None  # Tutte le app
+            
+            # Ranking: prima i nomi che iniziano con la ricerca, poi quelli che la contengono
+            tokens = search_text.split()
+            if len(tokens) > 1:
+                # Con più parole devono essere presenti tutte, in qualsiasi ordine
+                if source is None:
+                    source = range(len(names_lower))
+                matches = [p for p in source if all(tok in names_lower[p] for tok in tokens)]
+                prefix = [p for p in matches if names_lower[p].startswith(search_text)]
+                others = [p for p in matches if not names_lower[p].startswith(search_text)]
+            elif source is None:
+                # Sulla lista ordinata i prefissi sono un intervallo contiguo: due ricerche binarie
+                lo = bisect_left(names_lower, search_text)
+                hi = bisect_left(names_lower, search_text + '\U0010ffff', lo)
+                prefix = list(range(lo, hi))
+                # Le sottostringhe si cercano solo fuori dall'intervallo
+                outside = chain(range(lo), range(hi, len(names_lower)))
+                others = [p for p in outside if search_text in names_lower[p]]
+            else:
+                # startswith è più economico di "in": il test di sottostringa solo se fallisce
+                lowers = list(map(names_lower.__getitem__, source))
+                starts = list(map(str.startswith, lowers, repeat(search_text)))
+                prefix = list(compress(source, starts))
+                others = [p for p, nl, st in zip(source, lowers, starts) if not st and search_text in nl]
+            positions = prefix + others
+        self._last_query = search_text
+        self._last_filtered = positions
+
+        # Limita le righe create: l'utente ne vede comunque solo una decina
+        overflow = len(positions) - self.MAX_DISPLAYED
+        if overflow > 0:
+            positions = positions[:self.MAX_DISPLAYED]
 
-        # 📌 ORDINA ALFABETICAMENTE
-        temp_results.sort(key=lambda x: x[0].lower())
+        # Nessun risultato / risultati nascosti: riga finale non selezionabile
+        if not positions:
+            footer = "❌  No apps found"
+        elif overflow > 0:
+            footer = f"…  {overflow} more matches - refine your search"
+        else:
+            footer = None
 
-        # Aggiungi alla QListWidget dopo l'ordinamento
-        for name, original_index in temp_results:
-            item = QListWidgetItem(f"🎮  {name}")
-            item.setData(Qt.ItemDataRole.UserRole, original_index)
-            self.results_list.addItem(item)
-            self.filtered_indices.append(original_index)
+        # Un solo reset del modello: la vista formatta solo le righe visibili
+        self._results_model.set_rows(self._names, self._original_indices, positions, footer)
 
         # Seleziona primo risultato
-        if self.results_list.count() > 0:
+        if positions:
             self.current_selection = 0
-            self.results_list.setCurrentRow(0)
-
-        # Nessun risultato
-        if self.results_list.count() == 0:
-            item = QListWidgetItem("❌  No apps found")
-            item.setFlags(Qt.ItemFlag.NoItemFlags)
-            self.results_list.addItem(item)
+            self._set_current_row(0)
 
+    def _set_current_row(self, row):
+        """Seleziona la riga indicata nella lista risultati"""
+        self.results_list.setCurrentIndex(self._results_model.index(row))
     
     def update_mode_indicator(self):
         """Aggiorna l'indicatore della modalità"""
         if self.is_typing_mode:
             self.mode_label.setText("🔤 TYPING MODE")
-            self.mode_label.setStyleSheet(f"""
-                color: rgba(100, 200, 255, 0.8);
-                font-size: {self.scaling.scale_font(11)}px;
-                font-weight: 600;
-                padding: {self.scaling.scale(5)}px {self.scaling.scale(10)}px;
-            """)
+            self.mode_label.setStyleSheet(self._typing_qss)
         else:
             self.mode_label.setText("🎯 NAVIGATION MODE")
-            self.mode_label.setStyleSheet(f"""
-                color: rgba(100, 255, 150, 0.8);
-                font-size: {self.scaling.scale_font(11)}px;
-                font-weight: 600;
-                padding: {self.scaling.scale(5)}px {self.scaling.scale(10)}px;
-            """)
+            self.mode_label.setStyleSheet(self._nav_qss)
     
     def switch_mode(self):
         """Cambia tra modalità digitazione e navigazione"""
@@ -348,57 +497,48 @@ class QuickSearchWidget(QWidget):
         else:
             self.results_list.setFocus()
     
+    def _move(self, delta):
+        """Sposta la selezione di delta righe, limitata alle righe delle app"""
+        row_count = self._results_model.app_count()
+        if row_count > 0:
+            row = self.results_list.currentIndex().row() + delta
+            row = 0 if row < 0 else row_count - 1 if row >= row_count else row
+            self._set_current_row(row)
+        # Auto-switch a navigation mode
+        if self.is_typing_mode:
+            self.is_typing_mode = False
+            self.update_mode_indicator()
+    
     def navigate_up(self):
         """Naviga verso l'alto nei risultati"""
-        if self.results_list.count() > 0:
-            current = self.results_list.currentRow()
-            prev_row = max(current - 1, 0)
-            self.results_list.setCurrentRow(prev_row)
-            # Auto-switch a navigation mode
-            if self.is_typing_mode:
-                self.is_typing_mode = False
-                self.update_mode_indicator()
+        self._move(-1)
     
     def navigate_down(self):
         """Naviga verso il basso nei risultati"""
-        if self.results_list.count() > 0:
-            current = self.results_list.currentRow()
-            next_row = min(current + 1, self.results_list.count() - 1)
-            self.results_list.setCurrentRow(next_row)
-            # Auto-switch a navigation mode
-            if self.is_typing_mode:
-                self.is_typing_mode = False
-                self.update_mode_indicator()
+        self._move(1)
     
     def launch_selected(self):
         """Lancia l'app selezionata"""
-        if self.results_list.count() > 0 and self.filtered_indices:
-            current_row = self.results_list.currentRow()
-            if 0 <= current_row < len(self.filtered_indices):
-                app_index = self.filtered_indices[current_row]
-                self.app_selected.emit(app_index)
-                self.close_search()
+        # Applica subito un filtro ancora in attesa
+        if self._search_timer.isActive():
+            self._search_timer.stop()
+            self.update_results()
+        # L'indice originale dell'app è nel ruolo UserRole della riga corrente
+        self.on_item_activated(self.results_list.currentIndex())
     
-    def on_item_activated(self, item):
+    def on_item_activated(self, index):
         """Gestisce il doppio click o Enter su un item"""
-        if item and item.flags() & Qt.ItemFlag.ItemIsEnabled:
-            app_index = item.data(Qt.ItemDataRole.UserRole)
+        if index.isValid() and index.flags() & Qt.ItemFlag.ItemIsEnabled:
+            app_index = index.data(Qt.ItemDataRole.UserRole)
             if app_index is not None:
                 self.app_selected.emit(app_index)
                 self.close_search()
     
     def handle_joypad_input(self, key_code):
         """Gestisce gli input dal joypad (chiamato dal parent)"""
-        if key_code == Qt.Key.Key_Escape:
-            self.close_search()
-        elif key_code == Qt.Key.Key_Up:
-            self.navigate_up()
-        elif key_code == Qt.Key.Key_Down:
-            self.navigate_down()
-        elif key_code == Qt.Key.Key_Return or key_code == Qt.Key.Key_Enter:
-            self.launch_selected()
-        elif key_code == Qt.Key.Key_E:  # X button per cambio modalità
-            self.switch_mode()
+        handler = self._joypad_dispatch.get(key_code)
+        if handler is not None:
+            handler()
         elif key_code == Qt.Key.Key_Backspace:
             # Backspace in navigation mode torna a typing
             if not self.is_typing_mode:
@@ -410,30 +550,9 @@ class QuickSearchWidget(QWidget):
         """Gestisce gli input da tastiera"""
         key = event.key()
         
-        # Esc chiude sempre
-        if key == Qt.Key.Key_Escape:
-            self.close_search()
-            return
-        
-        # Tab cambia modalità
-        if key == Qt.Key.Key_Tab:
-            self.switch_mode()
-            event.accept()
-            return
-        
-        # Enter lancia l'app selezionata
-        if key == Qt.Key.Key_Return or key == Qt.Key.Key_Enter:
-            self.launch_selected()
-            return
-        
-        # Navigazione risultati (sempre attiva)
-        if key == Qt.Key.Key_Down:
-            self.navigate_down()
-            event.accept()
-            return
-        
-        if key == Qt.Key.Key_Up:
-            self.navigate_up()
+        handler = self._key_dispatch.get(key)
+        if handler is not None:
+            handler()
             event.accept()
             return
         